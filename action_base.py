@@ -1,7 +1,9 @@
 from src.backend.PluginManager.ActionBase import ActionBase  # type: ignore
 import os
-import traceback
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger as log  # type: ignore
 from PIL import Image  # type: ignore
 
@@ -13,13 +15,79 @@ from gi.repository import Gtk, Adw, GLib
 
 import globals as gl
 
-from .websocket_client import PipeWeaverWebSocketClient, MeterWebSocketClient
-from .image_renderer import ImageRenderer
+from .websocket_client import PipeWeaverWebSocketClient, MeterWebSocketClient, device_list
+from .image_renderer import ImageRenderer, LANCZOS, normalize_volume, source_volumes
 from .svg_converter import svg_to_pil, is_svg_file
 
+CONNECT_TIMEOUT = 5.0
+STATUS_WAIT_TIMEOUT = 0.6
+DEVICE_CACHE_MAX_AGE = 5.0
+VOLUME_FLUSH_DELAY = 0.04
+METER_RENDER_INTERVAL = 0.05
+METER_KEY_STEP = 2
+SETTINGS_FLUSH_DELAY_MS = 100
+ICON_SIZE = ImageRenderer.ICON_MAX_SIZE
+ICON_CACHE_MAX = 64
+
+_DEVICE_SECTIONS = (("sources", "source"), ("targets", "target"))
+_BOTH_MIXES = frozenset(("A", "B"))
+
+_icon_cache = OrderedDict()
+_icon_cache_lock = threading.Lock()
+_icon_pending = set()
+_icon_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="IconDecode")
+_io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="PipeWeaverIO")
+
+
+def _decode_icon(icon_path):
+    """Decode a picker icon at the size it is composited at"""
+    if is_svg_file(icon_path):
+        image = svg_to_pil(icon_path, (ICON_SIZE, ICON_SIZE))
+        if image is not None:
+            content_size = max(image.size)
+            if 0 < content_size < ICON_SIZE:
+                render_size = min(ICON_SIZE * ICON_SIZE // content_size, ICON_SIZE * 4)
+                image = svg_to_pil(icon_path, (render_size, render_size))
+        return image
+    
+    image = Image.open(icon_path)
+    
+    width, height = image.size
+    max_dimension = max(width, height)
+    
+    if max_dimension < ICON_SIZE:
+        upscale_factor = ICON_SIZE / max_dimension
+        new_width = int(width * upscale_factor)
+        new_height = int(height * upscale_factor)
+        image = image.resize((new_width, new_height), LANCZOS)
+    else:
+        image.thumbnail((ICON_SIZE, ICON_SIZE), LANCZOS)
+    
+    return image
+
+
+def _load_icon_into_cache(cache_key):
+    """Decode an icon on a worker thread and store the result (None on failure)"""
+    try:
+        image = _decode_icon(cache_key[0])
+    except Exception as e:
+        log.error(f"Error loading picker icon: {e}")
+        image = None
+    
+    with _icon_cache_lock:
+        _icon_pending.discard(cache_key)
+        _icon_cache[cache_key] = image
+        while len(_icon_cache) > ICON_CACHE_MAX:
+            _icon_cache.popitem(last=False)
+    return image
+
+
 class PipeWeaverAction(ActionBase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._meter_client = None
+        self._image_renderer = None
+        self._init_thread = None
         self.has_configuration = True
         self.client = PipeWeaverWebSocketClient()
         self.client.start()
@@ -27,7 +95,7 @@ class PipeWeaverAction(ActionBase):
         self.selected_device_id = None
         self.selected_device_name = None
         self.selected_device_type = None
-        self.selected_mixes = set(["A"])
+        self.selected_mixes = frozenset(("A",))
         self.selected_target_names = set()
         self.mute_targets_checkboxes = {}
         self.mute_all_checkbox = None
@@ -36,11 +104,28 @@ class PipeWeaverAction(ActionBase):
         self.volume_step = 5
         self._is_initializing = True
         self.icon_path_from_picker = None
-        self._icon_cache = {}
         self._current_meter_a = 0
         self._current_meter_b = 0
         self._current_meter_target = 0
-        self._meter_client = None
+        self._status_snapshot = None
+        self._device_index = None
+        self._linked_cache = {}
+        self._settings = {}
+        self._persisted_settings = None
+        self._settings_dirty = False
+        self._render_pending = False
+        self._last_render_key = None
+        self._last_render_ts = 0.0
+        self._meter_render_pending = False
+        self._pending_delta = 0
+        self._flush_timer = None
+        self._volume_lock = threading.Lock()
+        self._settings_loaded = False
+        self._device_lookup = ([], {}, {})
+        self._status_version = 0
+        self._devices_version = -1
+        self._devices_ts = 0.0
+        self._last_device_strs = []
 
         
         self._load_settings()
@@ -51,45 +136,117 @@ class PipeWeaverAction(ActionBase):
         
         self._start_meter_client()
         
-        GLib.idle_add(self.update_image)
+        self._schedule_render()
+    
+    @property
+    def selected_device_id(self):
+        return self._selected_device_id
+    
+    @selected_device_id.setter
+    def selected_device_id(self, device_id):
+        """Set the selected device, moving the meter subscription along with it"""
+        self._selected_device_id = device_id
+        if self._meter_client is not None:
+            self._meter_client.register(device_id, self._meter_callback)
     
     def _get_status_data(self):
-        """Fetch and parse PipeWeaver status data"""
-        return self.client._get_status()
+        """Get PipeWeaver status data, re-seeding the snapshot when the client has replaced its status"""
+        status = self.client._get_status()
+        if status is not self._status_snapshot:
+            self._on_status_replaced(status)
+        return status
     
-    def _get_device_by_id(self, device_id, device_type=None):
-        """Get device data from status by ID"""
+    def _on_status_replaced(self, status):
+        """Drop everything derived from the previous status object"""
+        self._status_snapshot = status
+        self._device_index = None
+        self._linked_cache.clear()
+        self._status_version += 1
+    
+    def _queue_settings(self, settings):
+        """Update the cached settings and queue a write, coalescing bursts into one delayed flush"""
+        self._settings = settings
+        if self._settings_dirty:
+            return
+        self._settings_dirty = True
+        GLib.timeout_add(SETTINGS_FLUSH_DELAY_MS, self._flush_settings)
+    
+    def _update_settings(self, **values):
+        """Apply settings values, queueing a write only if something changed"""
+        changed = {key: value for key, value in values.items() if self._settings.get(key) != value}
+        if not changed:
+            return
+        self._settings.update(changed)
+        self._queue_settings(self._settings)
+    
+    def _flush_settings(self):
+        """Write cached settings in a single set_settings call, skipping it if nothing changed on disk"""
+        if self._settings_dirty:
+            self._settings_dirty = False
+            if self._settings != self._persisted_settings:
+                self.set_settings(self._settings)
+                self._persisted_settings = dict(self._settings)
+        return False
+    
+    def _get_device_index(self):
+        """Get device lookup tables for the current status, rebuilding when it changes"""
         status_data = self._get_status_data()
         if not status_data:
             return None
         
-        devices = status_data.get("audio", {}).get("profile", {}).get("devices", {})
-        
-        search_sections = []
-        if device_type == "source":
-            search_sections.append(("sources", "virtual_devices"))
-        elif device_type == "target":
-            search_sections.append(("targets", "virtual_devices"))
-        else:
-            search_sections = [("sources", "virtual_devices"), ("targets", "virtual_devices")]
-        
-        for section, subsection in search_sections:
-            for device in devices.get(section, {}).get(subsection, []):
-                if device["description"]["id"] == device_id:
-                    return device
+        index = self._device_index
+        if index is not None and index["status"] is status_data:
+            return index
+        
+        by_id = {}
+        for section, device_type in _DEVICE_SECTIONS:
+            for device in device_list(status_data, section):
+                by_id[device["description"]["id"]] = (device_type, device)
+        
+        all_targets = [*device_list(status_data, "targets"), *device_list(status_data, "targets", "physical_devices")]
+        
+        target_by_name = {}
+        target_by_name_lower = {}
+        for target in all_targets:
+            target_name = target["description"]["name"]
+            target_by_name.setdefault(target_name, target)
+            target_by_name_lower.setdefault(target_name.lower(), target)
+        
+        index = {
+            "status": status_data,
+            "by_id": by_id,
+            "all_targets": all_targets,
+            "target_by_name": target_by_name,
+            "target_names": frozenset(target_by_name),
+            "target_by_name_lower": target_by_name_lower,
+        }
+        self._device_index = index
+        return index
+    
+    def _get_device_by_id(self, device_id, device_type=None):
+        """Get device data from status by ID"""
+        index = self._get_device_index()
+        if not index:
+            return None
         
-        return None
+        entry = index["by_id"].get(device_id)
+        if entry is None or (device_type and entry[0] != device_type):
+            return None
+        return entry[1]
     
     def _get_all_targets(self):
         """Get all available targets (virtual + physical)"""
-        status_data = self._get_status_data()
-        if not status_data:
+        index = self._get_device_index()
+        if not index:
             return []
-        
-        devices = status_data.get("audio", {}).get("profile", {}).get("devices", {})
-        virtual_targets = devices.get("targets", {}).get("virtual_devices", [])
-        physical_targets = devices.get("targets", {}).get("physical_devices", [])
-        return virtual_targets + physical_targets
+        return index["all_targets"]
+    
+    def _get_target_names(self):
+        """Get the set of all available target names"""
+        index = self._get_device_index()
+        if not index:
+            return frozenset()
+        return index["target_names"]
     
     def _get_selected_targets_list(self):
         """Get selected targets list, preferring active checkboxes over persistent state"""
@@ -118,23 +275,28 @@ class PipeWeaverAction(ActionBase):
         return mix_states, overall_muted
     
     def _toggle_mute(self):
-        """Toggle mute state for selected device and mixes"""
+        """Toggle mute state for selected device and mixes on the IO thread, without blocking the caller"""
         if not self.selected_device_id:
             return
         
+        _io_executor.submit(self._apply_mute_toggle)
+    
+    def _apply_mute_toggle(self):
+        """Send the mute/unmute commands for a toggle (let patches handle UI)"""
         try:
             if self.selected_device_type == "source":
                 selected_mixes = list(self.selected_mixes)
                 mix_states, overall_muted = self._get_source_mix_states(selected_mixes)
                 
-                if overall_muted:
-                    for mix in selected_mixes:
-                        if mix_states.get(mix, False):
-                            self.client.unmute_device(self.selected_device_id, mix)
-                else:
-                    for mix in selected_mixes:
-                        if not mix_states.get(mix, False):
-                            self.client.mute_device(self.selected_device_id, mix)
+                with self.client.batch():
+                    if overall_muted:
+                        for mix in selected_mixes:
+                            if mix_states.get(mix, False):
+                                self.client.unmute_device(self.selected_device_id, mix)
+                    else:
+                        for mix in selected_mixes:
+                            if not mix_states.get(mix, False):
+                                self.client.mute_device(self.selected_device_id, mix)
             else:
                 device_data = self._get_device_by_id(self.selected_device_id, "target")
                 if device_data:
@@ -161,7 +323,10 @@ class PipeWeaverAction(ActionBase):
     
     def _load_settings(self):
         """Load all settings from StreamController"""
-        settings = self.get_settings()
+        if not self._settings_dirty:
+            self._settings = self.get_settings()
+            self._persisted_settings = dict(self._settings)
+        settings = self._settings
         
         self._ensure_connection_and_load_devices()
         
@@ -171,17 +336,41 @@ class PipeWeaverAction(ActionBase):
         
         self.volume_step = settings.get('volume_step', 5)
         self.icon_path_from_picker = settings.get("icon_path_from_picker", None)
+        self._settings_loaded = bool(self.devices)
     
     def _ensure_connection_and_load_devices(self):
         """Wait for connection and load devices"""
         if not self.devices:
-            max_wait = 5.0
-            wait_time = 0.0
-            while not self.client.connected and wait_time < max_wait:
-                time.sleep(0.1)
-                wait_time += 0.1
+            self.client.connected_event.wait(timeout=CONNECT_TIMEOUT)
             
-            self.devices = self.client.get_devices() if self.client.connected else []
+            self._set_devices(self.client.get_devices() if self.client.connected else [])
+    
+    def _set_devices(self, devices):
+        """Replace the device list and its name/id lookup indexes, publishing all three at once"""
+        name_to_idx = {}
+        id_to_idx = {}
+        for i, device in enumerate(devices):
+            name_to_idx.setdefault(device['name'], i)
+            id_to_idx.setdefault(device['id'], i)
+        self._device_lookup = (devices, name_to_idx, id_to_idx)
+        self.devices = devices
+        self._devices_version = self._status_version
+        self._devices_ts = time.monotonic()
+    
+    def _lookup_device(self, name=None, device_id=None):
+        """Find a device by name (or by id) as (index, device), or (None, None), from one consistent snapshot"""
+        devices, name_to_idx, id_to_idx = self._device_lookup
+        idx = name_to_idx.get(name) if device_id is None else id_to_idx.get(device_id)
+        if idx is None:
+            return None, None
+        return idx, devices[idx]
+    
+    def _get_devices_cached(self, max_age=DEVICE_CACHE_MAX_AGE):
+        """Get the device list, refetching only after a status update or once it is too old"""
+        if (self._devices_version != self._status_version
+                or time.monotonic() - self._devices_ts >= max_age):
+            self._set_devices(self.client.get_devices())
+        return self.devices
     
     def _load_device_settings(self, settings):
         """Load and validate device settings"""
@@ -189,8 +378,8 @@ class PipeWeaverAction(ActionBase):
         saved_device_id = settings.get('device_id')
         
         if saved_device_name and self.devices:
-            device = next((d for d in self.devices if d['name'] == saved_device_name), None)
-            if device:
+            idx, device = self._lookup_device(saved_device_name)
+            if idx is not None:
                 self._set_selected_device(device, settings, saved_device_id)
                 return
         
@@ -205,9 +394,10 @@ class PipeWeaverAction(ActionBase):
         self._reset_meter_values()
         
         if saved_device_id != device['id']:
-            settings['device_id'] = device['id']
-            if not self._is_initializing:
-                self.set_settings(settings)
+            if self._is_initializing:
+                settings['device_id'] = device['id']
+            else:
+                self._update_settings(device_id=device['id'])
     
     def _reset_meter_values(self):
         """Reset meter values"""
@@ -218,51 +408,44 @@ class PipeWeaverAction(ActionBase):
     def _load_target_and_mix_settings(self, settings):
         """Load target names and mix selections"""
         saved_target_names = settings.get('selected_target_names')
-        self.selected_target_names = set([t for t in saved_target_names if t]) if saved_target_names else set()
+        self.selected_target_names = {t for t in saved_target_names if t} if saved_target_names else set()
         
         saved_mixes = settings.get('selected_mixes', ['A'])
-        self.selected_mixes = set(saved_mixes) if saved_mixes else set(["A"])
+        self.selected_mixes = frozenset(saved_mixes) if saved_mixes else frozenset(("A",))
     
     def get_config_rows(self):
         """Get configuration UI rows"""
         self._ensure_connection_and_load_devices()
         
         if self.client.connected and (not self.devices or len(self.devices) == 0):
-            max_retries = 3
-            retry_count = 0
-            while retry_count < max_retries and (not self.devices or len(self.devices) == 0):
-                time.sleep(0.2)
-                self.devices = self.client.get_devices()
-                retry_count += 1
+            if self.client.status_event.wait(timeout=STATUS_WAIT_TIMEOUT):
+                self._set_devices(self.client.get_devices())
         
         if not self.devices or len(self.devices) == 0:
             error_row = Adw.ActionRow()
-            error_row.set_title(self.plugin_base.lm.get("ui.error.not_running.title"))
-            error_row.set_subtitle(self.plugin_base.lm.get("ui.error.not_running.subtitle"))
+            error_row.set_title(self.plugin_base.tr("ui.error.not_running.title"))
+            error_row.set_subtitle(self.plugin_base.tr("ui.error.not_running.subtitle"))
             error_row.add_css_class("warning")
             return [error_row]
         
-        self._load_settings()
+        if not self._settings_loaded:
+            self._load_settings()
         
-        self.device_model = Gtk.StringList()
+        self._last_device_strs = self._format_device_strs(self.devices)
+        self.device_model = Gtk.StringList.new(self._last_device_strs)
         self.device_selector = Adw.ComboRow(
             model=self.device_model, 
-            title=self.plugin_base.lm.get("ui.device.title")
+            title=self.plugin_base.tr("ui.device.title")
         )
         
-        for device in self.devices:
-            self.device_model.append(f"{device['name']} ({device['type']})")
-        
-        if self.selected_device_name:
-            for i, device in enumerate(self.devices):
-                if device['name'] == self.selected_device_name:
-                    self.device_selector.set_selected(i)
-                    break
+        selected_index, _ = self._lookup_device(self.selected_device_name)
+        if selected_index is not None:
+            self.device_selector.set_selected(selected_index)
         
         self.device_selector.connect("notify::selected-item", self.on_device_changed)
         
         self.mix_header = Adw.PreferencesGroup()
-        self.mix_header.set_title(self.plugin_base.lm.get("ui.mix_selection.title"))
+        self.mix_header.set_title(self.plugin_base.tr("ui.mix_selection.title"))
         self.mix_header.set_description("Select mixes for source devices (A and/or B)")
         self.mix_header.set_margin_top(12)
         self.mix_header.set_margin_bottom(12)
@@ -281,30 +464,29 @@ class PipeWeaverAction(ActionBase):
         self.mix_b_checkbox.connect("toggled", self._on_mix_checkbox_changed, "B")
         
         mix_a_row = Adw.ActionRow()
-        mix_a_row.set_title(self.plugin_base.lm.get("ui.mix_a.title"))
+        mix_a_row.set_title(self.plugin_base.tr("ui.mix_a.title"))
         mix_a_row.add_suffix(self.mix_a_checkbox)
         
         mix_b_row = Adw.ActionRow()
-        mix_b_row.set_title(self.plugin_base.lm.get("ui.mix_b.title"))
+        mix_b_row.set_title(self.plugin_base.tr("ui.mix_b.title"))
         mix_b_row.add_suffix(self.mix_b_checkbox)
         
         self.mix_listbox.append(mix_a_row)
         self.mix_listbox.append(mix_b_row)
         
-        self.mute_targets_model = Gtk.StringList()
         self.mute_targets_checkboxes = {}
         
-        self._update_mute_targets()
+        if self.selected_device_type == "source":
+            self._update_mute_targets()
         
         icon_expander = Adw.ExpanderRow()
-        icon_expander.set_title(self.plugin_base.lm.get("ui.custom_icon.title"))
-        icon_expander.set_subtitle(self.plugin_base.lm.get("ui.custom_icon.subtitle"))
+        icon_expander.set_title(self.plugin_base.tr("ui.custom_icon.title"))
+        icon_expander.set_subtitle(self.plugin_base.tr("ui.custom_icon.subtitle"))
         
         icon_picker_row = Adw.ActionRow()
         icon_picker_row.set_title("Browse Icon Library")
         
         if hasattr(self, 'icon_path_from_picker') and self.icon_path_from_picker:
-            import os
             icon_name = os.path.splitext(os.path.basename(self.icon_path_from_picker))[0]
             icon_picker_row.set_subtitle(f"Selected: {icon_name}")
         else:
@@ -327,16 +509,15 @@ class PipeWeaverAction(ActionBase):
         icon_expander.add_row(remove_icon_row)
         
         self.volume_step_row = Adw.SpinRow.new_with_range(1, 20, 1)
-        self.volume_step_row.set_title(self.plugin_base.lm.get("ui.volume_step.title"))
-        self.volume_step_row.set_subtitle(self.plugin_base.lm.get("ui.volume_step.subtitle"))
+        self.volume_step_row.set_title(self.plugin_base.tr("ui.volume_step.title"))
+        self.volume_step_row.set_subtitle(self.plugin_base.tr("ui.volume_step.subtitle"))
         
-        settings = self.get_settings()
-        volume_step = settings.get("volume_step", 5)
+        volume_step = self._settings.get("volume_step", 5)
         self.volume_step_row.set_value(volume_step)
         
         self.volume_step_row.connect("notify::value", self.on_volume_step_changed)
 
-        refresh_btn = Gtk.Button.new_with_label(self.plugin_base.lm.get("ui.refresh_devices.button"))
+        refresh_btn = Gtk.Button.new_with_label(self.plugin_base.tr("ui.refresh_devices.button"))
         refresh_btn.add_css_class("suggested-action")
         refresh_btn.set_margin_top(24)
         refresh_btn.set_margin_bottom(12)
@@ -354,15 +535,16 @@ class PipeWeaverAction(ActionBase):
         
         return config_rows
     
+    def _format_device_strs(self, devices):
+        """Format device list entries for the device selector"""
+        return [f"{device['name']} ({device['type']})" for device in devices]
+    
     def on_device_changed(self, combo_row, *args):
         """Handle device selection change"""
         selected_index = combo_row.get_selected()
         if selected_index is not None and selected_index < len(self.devices):
             device = self.devices[selected_index]
-            settings = self.get_settings()
-            settings["device_id"] = device['id']
-            settings["device_name"] = device['name']
-            self.set_settings(settings)
+            self._update_settings(device_id=device['id'], device_name=device['name'])
             
             self.selected_device_id = device['id']
             self.selected_device_name = device['name']
@@ -377,26 +559,20 @@ class PipeWeaverAction(ActionBase):
     def on_volume_step_changed(self, spin_row, *args):
         """Handle volume step change"""
         volume_step = int(spin_row.get_value())
-        settings = self.get_settings()
-        settings["volume_step"] = volume_step
-        self.set_settings(settings)
+        self._update_settings(volume_step=volume_step)
         self.volume_step = volume_step
 
     
     def on_remove_icon_clicked(self, button, *args):
         """Handle remove icon button click"""
-        settings = self.get_settings()
-        settings["icon_path_from_picker"] = None
         self.icon_path_from_picker = None
-        
-        self._icon_cache.clear()
-        self.set_settings(settings)
+        self._update_settings(icon_path_from_picker=None)
         self._update_icon_display()
         
-        GLib.idle_add(self.update_image)
+        self._schedule_render()
         
         if hasattr(self, 'get_config_rows'):
-            self.on_settings_changed(settings)
+            self.on_settings_changed(self._settings)
     
     def on_icon_picker_clicked(self, button, *args):
         """Handle icon picker button click - opens StreamController's asset manager"""
@@ -413,13 +589,12 @@ class PipeWeaverAction(ActionBase):
             )
             
         except Exception as e:
-            log.error(f"Error opening icon picker: {e}")
-            log.error(traceback.format_exc())
+            log.exception(f"Error opening icon picker: {e}")
     
     def on_icon_selected_from_picker(self, icon_path, *args, **kwargs):
         """Handle icon selection from picker"""
         self.icon_path_from_picker = icon_path
-        self.set_settings({"icon_path_from_picker": icon_path})
+        self._update_settings(icon_path_from_picker=icon_path)
         self.update_image()
     
     def _update_icon_display(self):
@@ -427,42 +602,38 @@ class PipeWeaverAction(ActionBase):
         pass
     
     def _get_icon(self):
-        """Get the icon to display - returns PIL Image or None"""
-        if hasattr(self, 'icon_path_from_picker') and self.icon_path_from_picker and os.path.exists(self.icon_path_from_picker):
+        """Get the icon to display - returns PIL Image or None while it is still loading"""
+        icon_path = self.icon_path_from_picker
+        if icon_path and os.path.exists(icon_path):
             try:
-                cache_key = self.icon_path_from_picker
-                if cache_key in self._icon_cache:
-                    return self._icon_cache[cache_key]
-                
-                if is_svg_file(self.icon_path_from_picker):
-                    image = svg_to_pil(self.icon_path_from_picker, (400, 400))
-                else:
-                    image = Image.open(self.icon_path_from_picker)
-                    
-                    width, height = image.size
-                    max_dimension = max(width, height)
-                    
-                    if max_dimension < 200:
-                        upscale_factor = 400 / max_dimension
-                        new_width = int(width * upscale_factor)
-                        new_height = int(height * upscale_factor)
-                        image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                cache_key = (icon_path, os.path.getmtime(icon_path), ICON_SIZE)
+                with _icon_cache_lock:
+                    if cache_key in _icon_cache:
+                        _icon_cache.move_to_end(cache_key)
+                        return _icon_cache[cache_key]
+                    if cache_key in _icon_pending:
+                        return None
+                    _icon_pending.add(cache_key)
                 
-                self._icon_cache[cache_key] = image
-                return image
+                future = _icon_executor.submit(_load_icon_into_cache, cache_key)
+                future.add_done_callback(self._on_icon_loaded)
                 
             except Exception as e:
                 log.error(f"Error loading picker icon: {e}")
-                return None
         return None
     
+    def _on_icon_loaded(self, future):
+        """Re-render once a background icon decode has finished"""
+        if future.result() is not None:
+            self._schedule_render()
+    
     def _update_mute_targets(self):
         """Update mute targets based on current device selection"""
         self.mute_targets_checkboxes.clear()
         self.mute_all_checkbox = None
         
         if not hasattr(self, 'mute_targets_header') or self.mute_targets_header is None:
-            self.mute_targets_header = Adw.PreferencesGroup(title=self.plugin_base.lm.get("ui.mute_targets.title"))
+            self.mute_targets_header = Adw.PreferencesGroup(title=self.plugin_base.tr("ui.mute_targets.title"))
             self.mute_targets_header.set_description("Select targets to mute (for source devices)")
             self.mute_targets_header.set_margin_top(12)
             self.mute_targets_header.set_margin_bottom(12)
@@ -481,7 +652,7 @@ class PipeWeaverAction(ActionBase):
         self.mute_targets_container = self.mute_targets_header
         
         if not self.selected_device_id or self.selected_device_type != "source":
-            na_row = Adw.ActionRow(title=self.plugin_base.lm.get("ui.na_target.title"))
+            na_row = Adw.ActionRow(title=self.plugin_base.tr("ui.na_target.title"))
             self.mute_targets_listbox.append(na_row)
             return
         
@@ -489,25 +660,24 @@ class PipeWeaverAction(ActionBase):
             all_targets = self._get_all_targets()
             
             if all_targets:
+                target_names = self._get_target_names()
                 self.mute_all_checkbox = Gtk.CheckButton()
-                all_selected = len(self.selected_target_names) == len(all_targets) and len(all_targets) > 0
-                no_targets_selected = len(self.selected_target_names) == 0
+                all_selected = target_names <= self.selected_target_names
+                no_targets_selected = not self.selected_target_names
                 self.mute_all_checkbox.set_active(all_selected or no_targets_selected)
                 self.mute_all_checkbox.connect("toggled", self._on_mute_all_changed)
                 
                 mute_all_row = Adw.ActionRow()
-                mute_all_row.set_title(self.plugin_base.lm.get("ui.mute_to_all.title"))
+                mute_all_row.set_title(self.plugin_base.tr("ui.mute_to_all.title"))
                 mute_all_row.add_suffix(self.mute_all_checkbox)
                 
                 self.mute_targets_listbox.append(mute_all_row)
                 
                 for target in all_targets:
                     target_name = target['description']['name']
-                    target_id = target['description']['id']
                     
                     checkbox = Gtk.CheckButton()
-                    is_selected = target_name in self.selected_target_names and len(self.selected_target_names) > 0
-                    checkbox.set_active(is_selected)
+                    checkbox.set_active(target_name in self.selected_target_names)
                     
                     checkbox.connect("toggled", self._on_target_checkbox_changed, target_name)
                     
@@ -520,64 +690,66 @@ class PipeWeaverAction(ActionBase):
                     self.mute_targets_listbox.append(target_row)
                 
                 if len(self.mute_targets_checkboxes) == 0:
-                    no_target_row = Adw.ActionRow(title=self.plugin_base.lm.get("ui.no_targets_available.title"))
+                    no_target_row = Adw.ActionRow(title=self.plugin_base.tr("ui.no_targets_available.title"))
                     self.mute_targets_listbox.append(no_target_row)
             else:
-                error_row = Adw.ActionRow(title=self.plugin_base.lm.get("ui.failed_get_status.title"))
+                error_row = Adw.ActionRow(title=self.plugin_base.tr("ui.failed_get_status.title"))
                 self.mute_targets_listbox.append(error_row)
                 
         except Exception as e:
             log.error(f"Error updating mute targets: {e}")
-            error_row = Adw.ActionRow(title=self.plugin_base.lm.get("ui.error_loading_targets.title"))
+            error_row = Adw.ActionRow(title=self.plugin_base.tr("ui.error_loading_targets.title"))
             self.mute_targets_listbox.append(error_row)
     
     def _find_target_id_by_name(self, target_name):
         """Find target ID by name from the current device status"""
         try:
-            all_targets = self._get_all_targets()
-            
-            for target in all_targets:
-                if target['description']['name'] == target_name:
-                    return target['description']['id']
+            index = self._get_device_index()
+            if not index:
+                return None
             
-            for target in all_targets:
-                if target['description']['name'].lower() == target_name.lower():
-                    return target['description']['id']
+            target = index["target_by_name"].get(target_name)
+            if target is None:
+                target = index["target_by_name_lower"].get(target_name.lower())
+            if target is not None:
+                return target['description']['id']
                         
         except Exception as e:
             log.error(f"Error finding target ID for {target_name}: {e}")
         
         return None
     
+    def _set_checkbox_quietly(self, checkbox, active, handler):
+        """Set checkbox state without firing its handler, skipping no-op changes"""
+        if checkbox.get_active() == active:
+            return
+        checkbox.handler_block_by_func(handler)
+        checkbox.set_active(active)
+        checkbox.handler_unblock_by_func(handler)
+    
+    def _clear_target_checkboxes(self):
+        """Uncheck all individual target checkboxes without firing their handlers"""
+        for cb in self.mute_targets_checkboxes.values():
+            self._set_checkbox_quietly(cb, False, self._on_target_checkbox_changed)
+    
     def _sync_mute_all_checkbox(self):
         """Sync 'Mute to All' checkbox state based on current target selection"""
         if not self.mute_all_checkbox:
             return
         
         try:
-            all_targets = self._get_all_targets()
-            if not all_targets:
+            target_names = self._get_target_names()
+            if not target_names:
                 return
             
-            total_targets = len(all_targets)
-            selected_count = len(self.selected_target_names)
-            
-            should_be_checked = selected_count == 0 or selected_count == total_targets
+            all_selected = target_names <= self.selected_target_names
+            should_be_checked = all_selected or not self.selected_target_names
             
-            self.mute_all_checkbox.handler_block_by_func(self._on_mute_all_changed)
-            self.mute_all_checkbox.set_active(should_be_checked)
-            self.mute_all_checkbox.handler_unblock_by_func(self._on_mute_all_changed)
+            self._set_checkbox_quietly(self.mute_all_checkbox, should_be_checked, self._on_mute_all_changed)
             
-            if selected_count == total_targets:
-                for cb in self.mute_targets_checkboxes.values():
-                    cb.handler_block_by_func(self._on_target_checkbox_changed)
-                    cb.set_active(False)
-                    cb.handler_unblock_by_func(self._on_target_checkbox_changed)
-                
+            if all_selected:
+                self._clear_target_checkboxes()
                 self.selected_target_names.clear()
-                settings = self.get_settings()
-                settings['selected_target_names'] = list(self.selected_target_names)
-                self.set_settings(settings)
                 
         except Exception as e:
             log.error(f"Error syncing 'Mute to All' checkbox: {e}")
@@ -593,53 +765,47 @@ class PipeWeaverAction(ActionBase):
         
         self._sync_mute_all_checkbox()
         
-        settings = self.get_settings()
-        settings['selected_target_names'] = list(self.selected_target_names)
-        self.set_settings(settings)
+        self._update_settings(selected_target_names=sorted(self.selected_target_names))
     
     def _on_mute_all_changed(self, checkbox):
         """Handle 'Mute to All' checkbox change"""
         is_active = checkbox.get_active()
         
         if is_active:
-            for cb in self.mute_targets_checkboxes.values():
-                cb.handler_block_by_func(self._on_target_checkbox_changed)
-                cb.set_active(False)
-                cb.handler_unblock_by_func(self._on_target_checkbox_changed)
+            self._clear_target_checkboxes()
             
+            if not self.selected_target_names:
+                return
             self.selected_target_names.clear()
         else:
-            checkbox.handler_block_by_func(self._on_mute_all_changed)
-            checkbox.set_active(True)
-            checkbox.handler_unblock_by_func(self._on_mute_all_changed)
+            self._set_checkbox_quietly(checkbox, True, self._on_mute_all_changed)
+            return
         
-        settings = self.get_settings()
-        settings['selected_target_names'] = list(self.selected_target_names)
-        self.set_settings(settings)
+        self._update_settings(selected_target_names=sorted(self.selected_target_names))
     
     def _on_mix_checkbox_changed(self, checkbox, mix_name):
         """Handle mix checkbox state change"""
         is_active = checkbox.get_active()
         
         if is_active:
-            self.selected_mixes.add(mix_name)
+            self.selected_mixes = self.selected_mixes | {mix_name}
         else:
             if len(self.selected_mixes) == 1:
                 checkbox.handler_block_by_func(self._on_mix_checkbox_changed)
                 checkbox.set_active(True)
                 checkbox.handler_unblock_by_func(self._on_mix_checkbox_changed)
                 return
-            self.selected_mixes.discard(mix_name)
+            self.selected_mixes = self.selected_mixes - {mix_name}
         
-        settings = self.get_settings()
-        settings['selected_mixes'] = list(self.selected_mixes)
-        settings['selected_target_names'] = list(self.selected_target_names)
-        self.set_settings(settings)
+        self._update_settings(
+            selected_mixes=sorted(self.selected_mixes),
+            selected_target_names=sorted(self.selected_target_names)
+        )
     
     def on_refresh_clicked(self, button):
         """Handle refresh button click"""
         try:
-            self.devices = self.client.get_devices()
+            self._set_devices(self.client.get_devices())
             
             current_selection = self.device_selector.get_selected()
             current_device_name = None
@@ -648,33 +814,24 @@ class PipeWeaverAction(ActionBase):
             
             saved_device_name = self.selected_device_name
             
-            settings = self.get_settings()
-            saved_device_id = settings.get('device_id')
-            
             device_name_to_restore = current_device_name or saved_device_name
 
             self.device_selector.handler_block_by_func(self.on_device_changed)
             
-            while self.device_model.get_n_items() > 0:
-                self.device_model.remove(0)
-            for device in self.devices:
-                self.device_model.append(f"{device['name']} ({device['type']})")
-            
-            self.device_selector.queue_draw()
+            device_strs = self._format_device_strs(self.devices)
+            if device_strs != self._last_device_strs:
+                self.device_model.splice(0, self.device_model.get_n_items(), device_strs)
+                self._last_device_strs = device_strs
             
             if device_name_to_restore:
-                for i, device in enumerate(self.devices):
-                    if device['name'] == device_name_to_restore:
-                        self.device_selector.set_selected(i)
-                        self.selected_device_id = device['id']
-                        self.selected_device_name = device['name']
-                        self.selected_device_type = device['type']
-                        
-                        if saved_device_id != device['id']:
-                            settings['device_id'] = device['id']
-                            self.set_settings(settings)
-                        
-                        break
+                idx, device = self._lookup_device(device_name_to_restore)
+                if idx is not None:
+                    self.device_selector.set_selected(idx)
+                    self.selected_device_id = device['id']
+                    self.selected_device_name = device['name']
+                    self.selected_device_type = device['type']
+                    
+                    self._update_settings(device_id=device['id'])
             else:
                 if self.devices:
                     self.device_selector.set_selected(0)
@@ -682,9 +839,10 @@ class PipeWeaverAction(ActionBase):
                     self.selected_device_name = self.devices[0]['name']
                     self.selected_device_type = self.devices[0]['type']
                     
-                    settings['device_id'] = self.devices[0]['id']
-                    settings['device_name'] = self.devices[0]['name']
-                    self.set_settings(settings)
+                    self._update_settings(
+                        device_id=self.devices[0]['id'],
+                        device_name=self.devices[0]['name']
+                    )
             
             self.device_selector.handler_unblock_by_func(self.on_device_changed)
             
@@ -700,20 +858,20 @@ class PipeWeaverAction(ActionBase):
             if hasattr(self, 'mix_a_checkbox') and self.mix_a_checkbox:
                 mix_a_active = self.mix_a_checkbox.get_active()
                 if mix_a_active:
-                    self.selected_mixes.add("A")
+                    self.selected_mixes = self.selected_mixes | {"A"}
                 else:
-                    self.selected_mixes.discard("A")
+                    self.selected_mixes = self.selected_mixes - {"A"}
             if hasattr(self, 'mix_b_checkbox') and self.mix_b_checkbox:
                 mix_b_active = self.mix_b_checkbox.get_active()
                 if mix_b_active:
-                    self.selected_mixes.add("B")
+                    self.selected_mixes = self.selected_mixes | {"B"}
                 else:
-                    self.selected_mixes.discard("B")
+                    self.selected_mixes = self.selected_mixes - {"B"}
             
-            settings = self.get_settings()
-            settings['selected_mixes'] = list(self.selected_mixes)
-            settings['selected_target_names'] = list(self.selected_target_names)
-            self.set_settings(settings)
+            self._update_settings(
+                selected_mixes=sorted(self.selected_mixes),
+                selected_target_names=sorted(self.selected_target_names)
+            )
             
             self._update_mute_targets()
             
@@ -723,27 +881,20 @@ class PipeWeaverAction(ActionBase):
     def on_settings_changed(self, settings):
         """Handle settings changes"""
         if 'device_name' in settings:
-            saved_device_name = settings['device_name']
-            for device in self.devices:
-                if device['name'] == saved_device_name:
-                    self.selected_device_id = device['id']
-                    self.selected_device_name = device['name']
-                    self.selected_device_type = device['type']
-                    self._current_meter_a = 0
-                    self._current_meter_b = 0
-                    self._current_meter_target = 0
-                    break
+            idx, device = self._lookup_device(settings['device_name'])
+            if idx is not None:
+                self.selected_device_id = device['id']
+                self.selected_device_name = device['name']
+                self.selected_device_type = device['type']
+                self._reset_meter_values()
             self.update_image()
         elif 'device_id' in settings:
             self.selected_device_id = settings['device_id']
-            self._current_meter_a = 0
-            self._current_meter_b = 0
-            self._current_meter_target = 0
-            for device in self.devices:
-                if device['id'] == self.selected_device_id:
-                    self.selected_device_name = device['name']
-                    self.selected_device_type = device['type']
-                    break
+            self._reset_meter_values()
+            idx, device = self._lookup_device(device_id=self.selected_device_id)
+            if idx is not None:
+                self.selected_device_name = device['name']
+                self.selected_device_type = device['type']
             self.update_image()
     
     def _verify_and_update_device_id(self):
@@ -752,24 +903,29 @@ class PipeWeaverAction(ActionBase):
             return False
         
         try:
-            self.devices = self.client.get_devices()
+            self._get_devices_cached()
         except Exception as e:
             log.error(f"Failed to refresh device list: {e}")
             return False
         
-        for device in self.devices:
-            if device['name'] == self.selected_device_name:
-                if device['id'] != self.selected_device_id:
-                    old_id = self.selected_device_id
-                    self.selected_device_id = device['id']
-                    
-                    settings = self.get_settings()
-                    settings['device_id'] = device['id']
-                    self.set_settings(settings)
-                
-                return True
+        idx, device = self._lookup_device(self.selected_device_name)
+        if idx is None:
+            return False
         
-        return False
+        if device['id'] != self.selected_device_id:
+            self.selected_device_id = device['id']
+            
+            self._update_settings(device_id=device['id'])
+        
+        return True
+    
+    def _is_volume_linked(self, device_id):
+        """Check if volumes are linked for a source device, memoized until the next patch"""
+        is_linked = self._linked_cache.get(device_id)
+        if is_linked is None:
+            is_linked = self.client.is_volume_linked(device_id)
+            self._linked_cache[device_id] = is_linked
+        return is_linked
     
     def _toggle_volume_linking(self):
         """Toggle volume linking for source devices"""
@@ -789,22 +945,32 @@ class PipeWeaverAction(ActionBase):
             log.warning(f"Device ID verification failed for {self.selected_device_name}, continuing anyway")
         
         try:
-            is_linked = self.client.is_volume_linked(self.selected_device_id)
-            new_linked_state = not is_linked
-            success = self.client.set_volume_linked(self.selected_device_id, new_linked_state)
-            
-            if success:
-                self.devices = self.client.get_devices()
-                time.sleep(0.1)
-                updated_is_linked = self.client.is_volume_linked(self.selected_device_id)
-                self.update_image()
-            else:
-                log.error(f"Failed to toggle volume linking for {self.selected_device_name}")
+            device_id = self.selected_device_id
+            is_linked = self._is_volume_linked(device_id)
+            self._linked_cache[device_id] = not is_linked
+            self.update_image()
+            _io_executor.submit(self._apply_volume_linking, device_id, not is_linked)
         
         except Exception as e:
             log.error(f"Error toggling volume linking: {e}")
+    
+    def _apply_volume_linking(self, device_id, linked):
+        """Send a volume linking change, rolling back the optimistic state if it fails"""
+        try:
+            success = self.client.set_volume_linked(device_id, linked)
+        except Exception as e:
+            log.error(f"Error toggling volume linking: {e}")
+            success = False
         
-        
+        if not success:
+            log.error(f"Failed to toggle volume linking for {self.selected_device_name}")
+            self._linked_cache.pop(device_id, None)
+            self._schedule_render()
+    
+    def _preferred_mix(self):
+        """Get the mix that drives linked volumes: B if selected, else A, else None"""
+        return "B" if "B" in self.selected_mixes else "A" if "A" in self.selected_mixes else None
+    
     def _set_volume(self, volume):
         """Set volume for selected device (send change to API, let patches handle UI)"""
         if not self.selected_device_id or self._is_device_muted():
@@ -814,15 +980,12 @@ class PipeWeaverAction(ActionBase):
         
         try:
             if self.selected_device_type == "source":
-                is_linked = self.client.is_volume_linked(self.selected_device_id)
+                is_linked = self._is_volume_linked(self.selected_device_id)
                 
                 if is_linked:
-                    if "A" in self.selected_mixes and "B" in self.selected_mixes:
-                        self.client.set_volume(self.selected_device_id, volume, "B")
-                    elif "A" in self.selected_mixes:
-                        self.client.set_volume(self.selected_device_id, volume, "A")
-                    elif "B" in self.selected_mixes:
-                        self.client.set_volume(self.selected_device_id, volume, "B")
+                    mix = self._preferred_mix()
+                    if mix:
+                        self.client.set_volume(self.selected_device_id, volume, mix)
                 else:
                     for mix in self.selected_mixes:
                         self.client.set_volume(self.selected_device_id, volume, mix)
@@ -833,6 +996,26 @@ class PipeWeaverAction(ActionBase):
             log.error(f"Error setting volume: {e}")
     
     def _set_volume_relative(self, delta):
+        """Queue a relative volume change, coalescing rapid dial turns into one update"""
+        with self._volume_lock:
+            self._pending_delta += delta
+            if self._flush_timer is not None:
+                return
+            self._flush_timer = threading.Timer(VOLUME_FLUSH_DELAY, self._flush_volume_delta)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _flush_volume_delta(self):
+        """Apply the accumulated relative volume change"""
+        with self._volume_lock:
+            delta = self._pending_delta
+            self._pending_delta = 0
+            self._flush_timer = None
+        
+        if delta:
+            self._apply_volume_delta(delta)
+    
+    def _apply_volume_delta(self, delta):
         """Set volume relative to current for selected device (send change to API, let patches handle UI)"""
         if not self.selected_device_id or self._is_device_muted():
             return
@@ -841,18 +1024,13 @@ class PipeWeaverAction(ActionBase):
         
         try:
             if self.selected_device_type == "source":
-                is_linked = self.client.is_volume_linked(self.selected_device_id)
+                is_linked = self._is_volume_linked(self.selected_device_id)
                 
                 if is_linked:
-                    if "A" in self.selected_mixes and "B" in self.selected_mixes:
-                        current_volume = self._get_current_volume_for_mix("B") or 0
-                        self.client.set_volume_relative(self.selected_device_id, delta, "B", current_volume)
-                    elif "A" in self.selected_mixes:
-                        current_volume = self._get_current_volume_for_mix("A") or 0
-                        self.client.set_volume_relative(self.selected_device_id, delta, "A", current_volume)
-                    elif "B" in self.selected_mixes:
-                        current_volume = self._get_current_volume_for_mix("B") or 0
-                        self.client.set_volume_relative(self.selected_device_id, delta, "B", current_volume)
+                    mix = self._preferred_mix()
+                    if mix:
+                        current_volume = self._get_current_volume_for_mix(mix) or 0
+                        self.client.set_volume_relative(self.selected_device_id, delta, mix, current_volume)
                 else:
                     for mix in self.selected_mixes:
                         current_volume = self._get_current_volume_for_mix(mix) or 0
@@ -865,31 +1043,20 @@ class PipeWeaverAction(ActionBase):
             log.error(f"Error setting volume relative: {e}")
     
     def _get_current_volume_for_mix(self, mix):
-        """Get current volume for a specific mix, forcing a fresh status read"""
+        """Get current volume for a specific mix from the status snapshot"""
         if not self.selected_device_id:
             return None
         
         try:
-            status_data = self._get_status_data()
-            if not status_data:
-                return None
-            
             if self.selected_device_type == "source":
-                devices = status_data.get("audio", {}).get("profile", {}).get("devices", {})
-                for device in devices.get("sources", {}).get("virtual_devices", []):
-                    if device["description"]["id"] == self.selected_device_id:
-                        volumes_dict = device.get("volumes", {})
-                        if isinstance(volumes_dict, dict):
-                            volume_dict = volumes_dict.get("volume", {})
-                            if isinstance(volume_dict, dict):
-                                vol_raw = volume_dict.get(mix, 0)
-                                return int((vol_raw / 255.0) * 100) if vol_raw > 100 else vol_raw
+                device = self._get_device_by_id(self.selected_device_id, "source")
+                if device:
+                    return normalize_volume(source_volumes(device).get(mix, 0))
             else:
-                devices = status_data.get("audio", {}).get("profile", {}).get("devices", {})
-                for device in devices.get("targets", {}).get("virtual_devices", []):
-                    if device["description"]["id"] == self.selected_device_id:
-                        vol_raw = device.get("volume", 0)
-                        return int((vol_raw / 255.0) * 100) if vol_raw > 100 else vol_raw
+                device = self._get_device_by_id(self.selected_device_id, "target")
+                if device:
+                    vol_raw = device.get("volume", 0)
+                    return normalize_volume(vol_raw)
         except Exception as e:
             log.error(f"Error getting current volume for mix {mix}: {e}")
         
@@ -907,36 +1074,44 @@ class PipeWeaverAction(ActionBase):
             
             current_mute_states = device_data.get("mute_states", {}).get("mute_state", [])
             
-            if "A" in self.selected_mixes and "B" in self.selected_mixes:
+            if self.selected_mixes >= _BOTH_MIXES:
                 mix_a_muted = "TargetA" in current_mute_states
                 mix_b_muted = "TargetB" in current_mute_states
                 
                 if mix_a_muted != mix_b_muted:
-                    if mix_a_muted:
-                        self.client.mute_device(self.selected_device_id, "B")
-                    else:
-                        self.client.unmute_device(self.selected_device_id, "B")
+                    with self.client.batch():
+                        if mix_a_muted:
+                            self.client.mute_device(self.selected_device_id, "B")
+                        else:
+                            self.client.unmute_device(self.selected_device_id, "B")
             
         except Exception as e:
             log.error(f"Error syncing PipeWeaver state: {e}")
     
     def on_enable(self):
-        """Called when action is enabled"""
-        for _ in range(50):
-            if self.client.connected:
-                break
-            time.sleep(0.1)
-        
-        if self.client.connected:
-            self.devices = self.client.get_devices()
-        else:
-            log.warning("WebSocket not connected, devices may not be available")
-            self.devices = []
-        
-        self._load_settings()
-        self._sync_pipeweaver_state()
-        self.update_image()
+        """Called when action is enabled - loads state on a background thread so the key paints immediately"""
+        self.client.patch_callback = self._on_patch_update
+        if self._init_thread is not None and self._init_thread.is_alive():
+            return
+        self._init_thread = threading.Thread(target=self._async_init, daemon=True, name="PipeWeaverInit")
+        self._init_thread.start()
+    
+    def _async_init(self):
+        """Wait for the connection, load devices and settings, sync state, then queue a render"""
+        try:
+            if self.client.connected_event.wait(timeout=CONNECT_TIMEOUT):
+                self._set_devices(self.client.get_devices())
+            else:
+                log.warning("WebSocket not connected, devices may not be available")
+                self._set_devices([])
+            
+            self._load_settings()
+            self._sync_pipeweaver_state()
+        except Exception as e:
+            log.error(f"Error initializing action: {e}")
         
+        self._last_render_key = None
+        self._schedule_render()
     
     def on_ready(self):
         """Called when action is ready"""
@@ -946,31 +1121,30 @@ class PipeWeaverAction(ActionBase):
             self.set_top_label(None)
         
         self._start_meter_client()
+        self._schedule_render()
     
     def on_disable(self):
         """Called when action is disabled"""
         if self.client:
             self.client.patch_callback = None
         
+        self._flush_settings()
         self._stop_meter_client()
     
     def _meter_callback(self, node_id, percent):
-        """Callback for meter updates from WebSocket"""
-        device_id = node_id
-        if device_id != self.selected_device_id:
-            return
-
-        device_data_source = self._get_device_by_id(device_id, "source")
-        device_data_target = self._get_device_by_id(device_id, "target")
+        """Callback for meter updates from WebSocket for the selected device"""
+        index = self._get_device_index()
+        entry = index["by_id"].get(node_id) if index else None
+        device_type = entry[0] if entry else None
 
         meter_changed = False
         
-        if device_data_source:
+        if device_type == "source":
             if self._current_meter_a != percent or self._current_meter_b != percent:
                 self._current_meter_a = percent
                 self._current_meter_b = percent
                 meter_changed = True
-        elif device_data_target:
+        elif device_type == "target":
             if self._current_meter_target != percent:
                 self._current_meter_target = percent
                 meter_changed = True
@@ -982,15 +1156,15 @@ class PipeWeaverAction(ActionBase):
                 meter_changed = True
 
         if meter_changed:
-            self.update_image()
+            self._schedule_meter_render()
 
     
     def _start_meter_client(self):
         """Start WebSocket client for meter data"""
         try:
             if self._meter_client is None:
-                self._meter_client = MeterWebSocketClient(self._meter_callback)
-                self._meter_client.start()
+                self._meter_client = MeterWebSocketClient.instance()
+                self._meter_client.register(self._selected_device_id, self._meter_callback)
         except Exception as e:
             log.error(f"Error starting meter client: {e}")
     
@@ -998,13 +1172,15 @@ class PipeWeaverAction(ActionBase):
         """Stop WebSocket client for meter data"""
         try:
             if self._meter_client:
-                self._meter_client.stop()
+                self._meter_client.unregister(self._meter_callback)
                 self._meter_client = None
         except Exception as e:
             log.error(f"Error stopping meter client: {e}")
     
     def _on_patch_update(self, status):
         """Callback when status is updated via patches - update UI from API state"""
+        self._on_status_replaced(status)
+        
         if not self.selected_device_id:
             return
         
@@ -1014,32 +1190,91 @@ class PipeWeaverAction(ActionBase):
                 return
             
             if self.selected_device_type == "source":
-                volumes_dict = device_data.get("volumes", {})
-                volume_dict = volumes_dict.get("volume", {}) if isinstance(volumes_dict, dict) else {}
-                if isinstance(volume_dict, dict):
-                    volume_a_raw = volume_dict.get("A", 0)
-                    volume_b_raw = volume_dict.get("B", 0)
-                    volume_a = int((volume_a_raw / 255.0) * 100) if volume_a_raw > 100 else volume_a_raw
-                    volume_b = int((volume_b_raw / 255.0) * 100) if volume_b_raw > 100 else volume_b_raw
-                    
-                    if "B" in self.selected_mixes:
-                        self.volume = volume_b
-                    elif "A" in self.selected_mixes:
-                        self.volume = volume_a
-                else:
-                    self.volume = 0
+                mix = self._preferred_mix()
+                if mix:
+                    self.volume = normalize_volume(source_volumes(device_data).get(mix, 0))
             else:
                 volume_raw = device_data.get("volume", 0)
-                volume = int((volume_raw / 255.0) * 100) if volume_raw > 100 else volume_raw
+                volume = normalize_volume(volume_raw)
                 self.volume = volume
             
-            self.update_image()
+            self._schedule_render()
         
         except Exception as e:
             log.error(f"Error handling patch update: {e}")
     
+    def _schedule_render(self):
+        """Queue a single idle render, collapsing requests made before it runs"""
+        if self._render_pending:
+            return
+        self._render_pending = True
+        GLib.idle_add(self._render_once)
+    
+    def _schedule_meter_render(self):
+        """Queue a render for a meter change, limited to one per METER_RENDER_INTERVAL"""
+        if self._meter_render_pending:
+            return
+        
+        delay = self._last_render_ts + METER_RENDER_INTERVAL - time.monotonic()
+        if delay <= 0:
+            self._schedule_render()
+            return
+        
+        self._meter_render_pending = True
+        timer = threading.Timer(delay, self._on_meter_render_timer)
+        timer.daemon = True
+        timer.start()
+    
+    def _on_meter_render_timer(self):
+        """Render the latest meter values once the throttle interval has passed"""
+        self._meter_render_pending = False
+        self._schedule_render()
+    
+    def _render_once(self):
+        """Idle callback that performs the queued render"""
+        self._render_pending = False
+        self.update_image()
+        return False
+    
+    def _get_render_key(self):
+        """Get a signature of everything the rendered image depends on"""
+        device_state = None
+        device_data = self._get_device_by_id(self.selected_device_id, self.selected_device_type)
+        if device_data:
+            if self.selected_device_type == "source":
+                volume_dict = source_volumes(device_data)
+                device_state = (
+                    tuple(device_data.get("mute_states", {}).get("mute_state", [])),
+                    volume_dict.get("A", 0),
+                    volume_dict.get("B", 0),
+                    self._is_volume_linked(self.selected_device_id),
+                )
+            else:
+                device_state = (device_data.get("mute_state"), device_data.get("volume", 0))
+        
+        return (
+            self.selected_device_id,
+            self.selected_device_name,
+            self.selected_device_type,
+            self.selected_mixes,
+            getattr(self, '_menu_mode', False),
+            self.icon_path_from_picker,
+            self._get_icon() is not None,
+            device_state,
+            self._current_meter_a // METER_KEY_STEP,
+            self._current_meter_b // METER_KEY_STEP,
+            self._current_meter_target // METER_KEY_STEP,
+        )
+    
     def update_image(self):
         """Update button image - shows mute state or volume bars"""
-        if not hasattr(self, '_image_renderer'):
+        render_key = self._get_render_key()
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
+        self._last_render_ts = time.monotonic()
+        
+        if self._image_renderer is None:
             self._image_renderer = ImageRenderer(self)
-        self._image_renderer.render_image()
\ No newline at end of file
+        if not self._image_renderer.render_image():
+            self._last_render_key = None
\ No newline at end of file
@@ -1,26 +1,140 @@
 """Image rendering utilities for PipeWeaver actions"""
+import functools
 import os
 import sys
-import traceback
+import time
 
 from PIL import Image, ImageDraw, ImageFont  # type: ignore
 from loguru import logger as log  # type: ignore
 
 
+# Pillow-SIMD tracks Pillow 9, which predates the Image.Resampling enum
+LANCZOS = getattr(Image, "Resampling", Image).LANCZOS
+
+log.debug(f"Rendering with Pillow {getattr(Image, '__version__', 'unknown')}")
+
+ERROR_LOG_INTERVAL = 1.0
+
+_FONT_PATHS = (
+    "/usr/share/fonts/truetype/jetbrains-mono/JetBrainsMono-Bold.ttf",
+    "/usr/share/fonts/truetype/source-code-pro/SourceCodePro-Bold.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationMono-Bold.ttf",
+    "/usr/share/fonts/truetype/ubuntu/UbuntuMono-Bold.ttf",
+    "/usr/share/fonts/truetype/fira-code/FiraCode-Bold.ttf",
+    "/usr/share/fonts/truetype/jetbrains-mono/JetBrainsMono-Regular.ttf",
+    "/usr/share/fonts/truetype/source-code-pro/SourceCodePro-Regular.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf",
+    "/usr/share/fonts/TTF/arial.ttf",
+    "/System/Library/Fonts/Monaco.ttf",
+    "C:/Windows/Fonts/consola.ttf",
+)
+
+_WHITE = (255, 255, 255, 255)
+_LABEL_GREY = (204, 204, 204, 204)
+_BG_MUTED = (38, 38, 38, 255)
+_GREY_MUTED = (77, 77, 77, 255)
+_BG_ON = (20, 38, 20, 255)
+_OUTLINE_ON = (102, 204, 102, 255)
+_FILL_ON = (102, 255, 102, 255)
+_OUTLINE_A_SELECTED = (102, 153, 255, 255)
+_BG_A = (26, 26, 51, 255)
+_OUTLINE_A = (51, 77, 128, 255)
+_FILL_A = (102, 179, 255, 255)
+_OUTLINE_B_SELECTED = (255, 153, 51, 255)
+_BG_B = (51, 26, 13, 255)
+_OUTLINE_B = (128, 77, 26, 255)
+_FILL_B = (255, 179, 77, 255)
+_METER_BLACK = (0, 0, 0, 255)
+
+# (label, action, selected fill, dimmed fill (60%), outline)
+_MENU_BUTTONS = (
+    ("Link", "link", (100, 200, 100, 255), (60, 120, 60, 255), (90, 180, 90, 255)),
+    ("A", "bus_a", (102, 179, 255, 255), (61, 107, 153, 255), _OUTLINE_A),
+    ("B", "bus_b", (255, 179, 77, 255), (153, 107, 46, 255), _OUTLINE_B),
+)
+
+_VOLUME_LUT = tuple(v if v <= 100 else int((v / 255.0) * 100) for v in range(256))
+
+
+def normalize_volume(vol_raw):
+    """Convert a raw PipeWeaver volume (0-100, or 0-255 when above 100) to a percentage"""
+    if isinstance(vol_raw, int) and 0 <= vol_raw < 256:
+        return _VOLUME_LUT[vol_raw]
+    return int((vol_raw / 255.0) * 100) if vol_raw > 100 else vol_raw
+
+
+@functools.lru_cache(maxsize=32)
+def _load_icon_rgba(path):
+    """Decode an icon file to RGBA once"""
+    with Image.open(path) as icon:
+        return icon.convert('RGBA')
+
+
+@functools.lru_cache(maxsize=64)
+def _load_icon_resized(path, size):
+    """Get an icon resized to a size x size square, decoding and resizing once per size"""
+    return _load_icon_rgba(path).resize((size, size), LANCZOS)
+
+
+@functools.lru_cache(maxsize=32)
+def _bar_tile(width, height, radius, fill, outline, outline_width):
+    """Rasterize a filled, outlined (optionally rounded) bar once per geometry and color combination"""
+    tile = Image.new('RGBA', (width + 1, height + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(tile)
+    if radius > 0:
+        draw.rounded_rectangle((0, 0, width, height), radius=radius, fill=fill,
+                               outline=outline, width=outline_width)
+    else:
+        draw.rectangle((0, 0, width, height), fill=fill, outline=outline, width=outline_width)
+    return tile
+
+
+def source_volumes(device):
+    """Get a source device's raw per-mix volumes ({"A": ..., "B": ...}), or {} if they are missing"""
+    try:
+        return device["volumes"]["volume"] or {}
+    except (KeyError, TypeError):
+        return {}
+
+
 class ImageRenderer:
     """Renders images for PipeWeaver actions using PIL"""
     
+    ICON_MAX_SIZE = 150
+    IMAGE_SIZE = (480, 240)
+    
+    _font_cache = {}
+    _resolved_font_path = None
+    
     def __init__(self, action):
         """Initialize renderer with action instance"""
         self.action = action
+        self._asset_paths = {}
+        self._canvas = Image.new('RGBA', self.IMAGE_SIZE, (0, 0, 0, 0))
+        self._draw = ImageDraw.Draw(self._canvas)
+        self._menu_buttons = self._build_menu_buttons()
+        self._menu_hit_rects = tuple(
+            (button['x'], button['y'], button['x'] + button['width'], button['y'] + button['height'], button)
+            for button in self._menu_buttons
+        )
+        self._can_render = hasattr(action, 'set_media')
+        self._has_set_label = hasattr(action, 'set_label')
+        self._has_set_bottom_label = hasattr(action, 'set_bottom_label')
+        self._has_set_top_label = hasattr(action, 'set_top_label')
+        self._error_log_times = {}
     
     def render_image(self):
-        """Render the button image - shows mute state or volume bars"""
+        """Render the button image - shows mute state or volume bars; returns False if drawing failed"""
         if not self.action.selected_device_name:
             display_text = self.action.selected_device_name if self.action.selected_device_name else "PipeWeaver"
-            if hasattr(self.action, 'set_label'):
+            if self._has_set_label:
                 self.action.set_label(text=display_text, position="center", font_size=10)
-            return
+            return True
+        
+        if not self._can_render:
+            return True
 
         self.action._verify_and_update_device_id()
         
@@ -29,39 +143,40 @@ class ImageRenderer:
         muted = False
         device_data = None
         is_linked = False
+        is_a_muted = False
+        is_b_muted = False
+        volume_dict = {}
+        selected_mixes = self.action.selected_mixes
+        is_a_selected = "A" in selected_mixes
+        is_b_selected = "B" in selected_mixes
         
         try:
             if self.action.selected_device_type == "source":
                 device_data = self.action._get_device_by_id(self.action.selected_device_id, "source")
                 if device_data:
-                    mute_states = device_data.get("mute_states", {}).get("mute_state", [])
-                    selected_mixes = list(self.action.selected_mixes)
+                    mute_states = (device_data.get("mute_states") or {}).get("mute_state") or ()
                     
                     is_a_muted = "TargetA" in mute_states
                     is_b_muted = "TargetB" in mute_states
                     
-                    is_linked = False
-                    volumes_dict = device_data.get("volumes", {})
-                    if isinstance(volumes_dict, dict):
-                        volumes_linked = volumes_dict.get("volumes_linked")
-                        is_linked = volumes_linked is not None
+                    volumes_dict = device_data.get("volumes") or {}
+                    volume_dict = volumes_dict.get("volume") or {}
+                    is_linked = self.action._is_volume_linked(self.action.selected_device_id)
                     
                     if is_linked:
                         muted = is_b_muted
-                        is_a_selected = "A" in self.action.selected_mixes
-                        is_b_selected = "B" in self.action.selected_mixes
                         if is_b_selected:
                             is_a_muted = is_b_muted
                     else:
-                        muted = any(f"Target{mix}" in mute_states for mix in selected_mixes)
+                        muted = (is_a_muted and is_a_selected) or (is_b_muted and is_b_selected)
             else:
                 device_data = self.action._get_device_by_id(self.action.selected_device_id, "target")
                 if device_data:
                     muted = device_data.get("mute_state") == "Muted"
                     is_a_muted = muted
                     is_b_muted = muted
-        except Exception as e:
-            log.error(f"Error getting mute state: {e}")
+        except Exception:
+            self._log_render_error("Error getting mute state")
             muted = False
             is_a_muted = False
             is_b_muted = False
@@ -70,332 +185,230 @@ class ImageRenderer:
             if hasattr(self.action, '_menu_mode') and self.action._menu_mode:
                 image = self._render_menu()
             elif self.action.selected_device_type == "source":
-                image = self._render_source_device(device_data, muted, device_short, is_a_muted, is_b_muted)
+                image = self._render_source_device(device_data, muted, device_short, is_a_muted, is_b_muted,
+                                                   volume_dict, is_linked, is_a_selected, is_b_selected)
             else:
                 image = self._render_target_device(device_data, muted, device_short)
             
             if image:
-                self._set_image_on_action(image, device_short)
-        except Exception as e:
-            log.error(f"Error drawing volume bars: {e}")
-            log.error(traceback.format_exc())
+                return self._set_image_on_action(image, device_short)
+        except Exception:
+            self._log_render_error("Error drawing volume bars")
+            return False
+        return True
+    
+    def _log_render_error(self, message):
+        """Log the current exception, at most once per ERROR_LOG_INTERVAL for the same message"""
+        now = time.monotonic()
+        if now - self._error_log_times.get(message, -ERROR_LOG_INTERVAL) < ERROR_LOG_INTERVAL:
+            return
+        self._error_log_times[message] = now
+        log.exception(message)
+    
+    def _clear_canvas(self):
+        """Clear the reusable canvas to transparent and return it with its draw context"""
+        self._canvas.paste((0, 0, 0, 0), (0, 0) + self.IMAGE_SIZE)
+        return self._canvas, self._draw
+    
+    def _get_asset_path(self, icon_name):
+        """Resolve a bundled icon path once, returning None if the file is missing"""
+        if icon_name not in self._asset_paths:
+            icon_path = self.action.plugin_base.get_asset_path(icon_name, ["icons"])
+            self._asset_paths[icon_name] = icon_path if os.path.exists(icon_path) else None
+        return self._asset_paths[icon_name]
     
     def _load_monospace_font(self, size=12):
-        """Load a bold, clean monospace font with fallback to default"""
-        font_paths = [
-            "/usr/share/fonts/truetype/jetbrains-mono/JetBrainsMono-Bold.ttf",
-            "/usr/share/fonts/truetype/source-code-pro/SourceCodePro-Bold.ttf", 
-            "/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationMono-Bold.ttf",
-            "/usr/share/fonts/truetype/ubuntu/UbuntuMono-Bold.ttf",
-            "/usr/share/fonts/truetype/fira-code/FiraCode-Bold.ttf",
-            "/usr/share/fonts/truetype/jetbrains-mono/JetBrainsMono-Regular.ttf",
-            "/usr/share/fonts/truetype/source-code-pro/SourceCodePro-Regular.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf",
-            "/usr/share/fonts/TTF/arial.ttf",
-            "/System/Library/Fonts/Monaco.ttf",
-            "C:/Windows/Fonts/consola.ttf",
-        ]
+        """Load a bold, clean monospace font with fallback to default, cached per size"""
+        font = self._font_cache.get(size)
+        if font is not None:
+            return font
+        
+        if ImageRenderer._resolved_font_path is None:
+            ImageRenderer._resolved_font_path = next((p for p in _FONT_PATHS if os.path.exists(p)), "")
         
-        for font_path in font_paths:
-            try:
-                return ImageFont.truetype(font_path, size)
-            except:
-                continue
+        font_path = ImageRenderer._resolved_font_path
+        try:
+            font = ImageFont.truetype(font_path, size) if font_path else ImageFont.load_default()
+        except OSError as e:
+            log.warning(f"Error loading font {font_path}: {e}")
+            font = ImageFont.load_default()
         
-        return ImageFont.load_default()
+        self._font_cache[size] = font
+        return font
     
-    def _render_source_device(self, device_data, muted, device_short, is_a_muted=False, is_b_muted=False):
+    def _render_source_device(self, device_data, muted, device_short, is_a_muted=False, is_b_muted=False,
+                              volume_dict=None, is_linked=False, is_a_selected=False, is_b_selected=False):
         """Render image for source device with two volume bars"""
-        if device_data:
-            try:
-                volumes_dict = device_data.get("volumes", {})
-                if isinstance(volumes_dict, dict):
-                    volume_dict = volumes_dict.get("volume", {})
-                    if isinstance(volume_dict, dict):
-                        volume_a_raw = volume_dict.get("A", 0)
-                        volume_b_raw = volume_dict.get("B", 0)
-                        
-                        if volume_a_raw > 100:
-                            volume_a = int((volume_a_raw / 255.0) * 100)
-                        else:
-                            volume_a = volume_a_raw
-                        
-                        if volume_b_raw > 100:
-                            volume_b = int((volume_b_raw / 255.0) * 100)
-                        else:
-                            volume_b = volume_b_raw
-                        
-                        volumes = [volume_a, volume_b]
-                    else:
-                        volumes = [0, 0]
-                else:
-                    volumes = [0, 0]
-            except Exception as vol_e:
-                log.error(f"Error accessing volume data: {vol_e}")
-                volumes = [0, 0]
-        else:
-            volumes = [0, 0]
+        volume_dict = volume_dict or {}
+        volume_a = normalize_volume(volume_dict.get("A", 0))
+        volume_b = normalize_volume(volume_dict.get("B", 0))
         
-        try:
-            is_linked = False
-            if device_data:
-                volumes_dict = device_data.get("volumes", {})
-                if isinstance(volumes_dict, dict):
-                    volumes_linked = volumes_dict.get("volumes_linked")
-                    is_linked = volumes_linked is not None
-            
-            image_width = 480
-            image_height = 240
-            
-            image = Image.new('RGBA', (image_width, image_height), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(image)
-            
-            try:
-                font = self._load_monospace_font(34)
-            except:
-                try:
-                    font = self._load_monospace_font(34)
-                except:
-                    font = ImageFont.load_default()
-            
-            edge_padding = 10
-            
-            icon_max_size = 150
-            icon_bottom_y = image_height - icon_max_size - edge_padding
-            icon_left_x = edge_padding
-            
-            left_margin = icon_max_size + edge_padding + edge_padding
-            right_margin = edge_padding
-            bar_width = image_width - left_margin - right_margin
-            bar_height = 24
-            bar_spacing = 12
-            start_x = left_margin
-            bar_b_y = image_height - bar_height - edge_padding - 15
-            bar_a_y = bar_b_y - bar_height - bar_spacing
-            
-            device_name = self.action.selected_device_name[:25] if self.action.selected_device_name else "Unknown"
-            
-            draw.text((edge_padding, edge_padding), device_name, fill=(255, 255, 255, 255), font=font)
-
-            try:
-                label_font = self._load_monospace_font(12)
-            except:
-                label_font = ImageFont.load_default()
-
-            draw.text((start_x + 4, bar_a_y - 15), "VOL", fill=(204, 204, 204, 204), font=label_font)
+        image_width = 480
+        image_height = 240
+        
+        image, draw = self._clear_canvas()
+        
+        font = self._load_monospace_font(34)
+        
+        edge_padding = 10
+        
+        icon_max_size = self.ICON_MAX_SIZE
+        icon_bottom_y = image_height - icon_max_size - edge_padding
+        icon_left_x = edge_padding
+        
+        left_margin = icon_max_size + edge_padding + edge_padding
+        right_margin = edge_padding
+        bar_width = image_width - left_margin - right_margin
+        bar_height = 24
+        bar_spacing = 12
+        start_x = left_margin
+        bar_b_y = image_height - bar_height - edge_padding - 15
+        bar_a_y = bar_b_y - bar_height - bar_spacing
+        
+        device_name = self.action.selected_device_name[:25] if self.action.selected_device_name else "Unknown"
+        
+        draw.text((edge_padding, edge_padding), device_name, fill=_WHITE, font=font)
 
-            meter_label_y = bar_a_y + bar_height + 12
-            draw.text((start_x + 4, meter_label_y), "LVL", fill=(204, 204, 204, 204), font=label_font)
+        label_font = self._load_monospace_font(12)
 
-            volume_a = volumes[0] if len(volumes) > 0 else 0
-            volume_b = volumes[1] if len(volumes) > 1 else 0
-            
-            if is_linked:
-                pass
-            
-            bar_a_fill_width = int((volume_a / 100.0) * bar_width)
-            bar_b_fill_width = int((volume_b / 100.0) * bar_width)
-            
-            is_a_selected = "A" in self.action.selected_mixes
-            is_b_selected = "B" in self.action.selected_mixes
+        draw.text((start_x + 4, bar_a_y - 15), "VOL", fill=_LABEL_GREY, font=label_font)
 
-            indicators_y = bar_a_y - 45
+        meter_label_y = bar_a_y + bar_height + 12
+        draw.text((start_x + 4, meter_label_y), "LVL", fill=_LABEL_GREY, font=label_font)
 
-            total_indicators = (1 if is_linked else 0) + (1 if is_a_selected else 0) + (1 if is_b_selected else 0)
+        bar_a_fill_width = volume_a * bar_width // 100
+        bar_b_fill_width = volume_b * bar_width // 100
 
-            if total_indicators > 0:
-                indicator_index = 0
+        indicators_y = bar_a_y - 45
 
-                icon_size = 48
-                icon_x = start_x + 4
-                icon_y = indicators_y - 4
+        if is_linked or is_a_selected or is_b_selected:
+            icon_size = 48
+            icon_x = start_x + 4
+            icon_y = indicators_y - 4
 
-                if is_linked:
-                    icon_name = "linked-white.png"
-                else:
-                    icon_name = "unlinked-dimmed.png"
-                
-                icon_path = self.action.plugin_base.get_asset_path(icon_name, ["icons"])
-                if os.path.exists(icon_path):
-                    link_icon = Image.open(icon_path)
-                    if link_icon.mode == 'P':
-                        link_icon = link_icon.convert('RGBA')
-                    link_icon_resized = link_icon.resize((icon_size, icon_size), Image.Resampling.LANCZOS)
-                    if link_icon_resized.mode != 'RGBA':
-                        link_icon_resized = link_icon_resized.convert('RGBA')
-                    image.paste(link_icon_resized, (icon_x, icon_y), link_icon_resized)
-                indicator_index += 1
+            if is_linked:
+                icon_name = "linked-white.png"
+            else:
+                icon_name = "unlinked-dimmed.png"
+            
+            icon_path = self._get_asset_path(icon_name)
+            if icon_path:
+                link_icon_resized = _load_icon_resized(icon_path, icon_size)
+                image.paste(link_icon_resized, (icon_x, icon_y), link_icon_resized)
 
-            self._draw_unlinked_bars(draw, start_x, bar_width, bar_a_y, bar_b_y, bar_height,
-                                    bar_a_fill_width, bar_b_fill_width, is_a_selected, is_b_selected, 
-                                    is_a_muted, is_b_muted)
+        self._draw_unlinked_bars(draw, start_x, bar_width, bar_a_y, bar_b_y, bar_height,
+                                bar_a_fill_width, bar_b_fill_width, is_a_selected, is_b_selected, 
+                                is_a_muted, is_b_muted)
 
-            self._composite_icon(image, icon_left_x, icon_bottom_y, icon_max_size)
+        self._composite_icon(image, icon_left_x, icon_bottom_y, icon_max_size)
 
-            return image
-        except Exception as img_e:
-            log.error(f"Error creating image: {img_e}")
-            log.error(traceback.format_exc())
-            return None
+        return image.copy()
     
     def _render_target_device(self, device_data, muted, device_short):
         """Render image for target device with single volume bar"""
         if device_data:
-            volume_raw = device_data.get("volume", 0)
-            if volume_raw > 100:
-                volume = int((volume_raw / 255.0) * 100)
-            else:
-                volume = volume_raw
+            volume = normalize_volume(device_data.get("volume", 0))
         else:
             volume = 0
         
-        try:
-            image_width = 480
-            image_height = 240
-            
-            image = Image.new('RGBA', (image_width, image_height), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(image)
-            
-            try:
-                font = self._load_monospace_font(34)
-            except:
-                try:
-                    font = self._load_monospace_font(34)
-                except:
-                    font = ImageFont.load_default()
-            
-            edge_padding = 10
-            
-            icon_max_size = 150
-            icon_bottom_y = image_height - icon_max_size - edge_padding
-            icon_left_x = edge_padding
-            
-            left_margin = icon_max_size + edge_padding + edge_padding
-            right_margin = edge_padding
-            bar_width = image_width - left_margin - right_margin
-            bar_height = 24
-            bar_x = left_margin
-            bar_y = image_height - bar_height - edge_padding - 15
-            
-            display_volume = volume
-            bar_fill_width = int((display_volume / 100.0) * bar_width)
-
-            device_name = self.action.selected_device_name[:25] if self.action.selected_device_name else "Unknown"
-            
-            draw.text((edge_padding, edge_padding), device_name, fill=(255, 255, 255, 255), font=font)
+        image_width = 480
+        image_height = 240
+        
+        image, draw = self._clear_canvas()
+        
+        font = self._load_monospace_font(34)
+        
+        edge_padding = 10
+        
+        icon_max_size = self.ICON_MAX_SIZE
+        icon_bottom_y = image_height - icon_max_size - edge_padding
+        icon_left_x = edge_padding
+        
+        left_margin = icon_max_size + edge_padding + edge_padding
+        right_margin = edge_padding
+        bar_width = image_width - left_margin - right_margin
+        bar_height = 24
+        bar_x = left_margin
+        bar_y = image_height - bar_height - edge_padding - 15
+        
+        display_volume = volume
+        bar_fill_width = display_volume * bar_width // 100
 
-            try:
-                label_font = self._load_monospace_font(12)
-            except:
-                label_font = ImageFont.load_default()
+        device_name = self.action.selected_device_name[:25] if self.action.selected_device_name else "Unknown"
+        
+        draw.text((edge_padding, edge_padding), device_name, fill=_WHITE, font=font)
 
-            draw.text((bar_x + 4, bar_y - 15), "VOL", fill=(204, 204, 204, 204), font=label_font)
+        label_font = self._load_monospace_font(12)
 
-            meter_label_y = bar_y + bar_height + 12
-            draw.text((bar_x + 4, meter_label_y), "LVL", fill=(204, 204, 204, 204), font=label_font)
+        draw.text((bar_x + 4, bar_y - 15), "VOL", fill=_LABEL_GREY, font=label_font)
 
-            if muted:
-                bg_color = (38, 38, 38, 255)
-                outline_color = (77, 77, 77, 255)
-            else:
-                bg_color = (20, 38, 20, 255)
-                outline_color = (102, 204, 102, 255)
+        meter_label_y = bar_y + bar_height + 12
+        draw.text((bar_x + 4, meter_label_y), "LVL", fill=_LABEL_GREY, font=label_font)
 
-            radius = bar_height // 2
+        if muted:
+            bg_color = _BG_MUTED
+            outline_color = _GREY_MUTED
+        else:
+            bg_color = _BG_ON
+            outline_color = _OUTLINE_ON
 
-            self._draw_rounded_rect(draw, (bar_x, bar_y, bar_x + bar_width, bar_y + bar_height), radius, bg_color)
+        radius = bar_height // 2
 
-            self._draw_rounded_rect_outline(draw, (bar_x, bar_y, bar_x + bar_width, bar_y + bar_height), radius, outline_color, 2)
+        bar_tile = _bar_tile(bar_width, bar_height, radius, bg_color, outline_color, 2)
+        image.paste(bar_tile, (bar_x, bar_y), bar_tile)
 
-            if bar_fill_width > 0:
-                fill_color = (77, 77, 77, 255) if muted else (102, 255, 102, 255)
-                fill_x1 = bar_x + 2
-                fill_x2 = bar_x + min(bar_fill_width, bar_width - 2)
-                fill_y1 = bar_y + 2
-                fill_y2 = bar_y + bar_height - 2
-                if fill_x2 > fill_x1:
-                    self._draw_rounded_rect(draw, (fill_x1, fill_y1, fill_x2, fill_y2), max(0, radius - 2), fill_color)
-            
-            meter_value = self.action._current_meter_target
-            if meter_value > 0 and bar_fill_width > 0:
-                self._draw_animated_meter(draw, meter_value, bar_fill_width, bar_x, bar_width,
-                                        bar_y + bar_height - 9, 6, radius)
-            
-            self._composite_icon(image, icon_left_x, icon_bottom_y, icon_max_size)
+        if bar_fill_width > 0:
+            fill_color = _GREY_MUTED if muted else _FILL_ON
+            fill_x1 = bar_x + 2
+            fill_x2 = bar_x + min(bar_fill_width, bar_width - 2)
+            fill_y1 = bar_y + 2
+            fill_y2 = bar_y + bar_height - 2
+            if fill_x2 > fill_x1:
+                self._draw_rounded_rect(draw, (fill_x1, fill_y1, fill_x2, fill_y2), max(0, radius - 2), fill_color)
+        
+        meter_value = self.action._current_meter_target
+        if meter_value > 0 and bar_fill_width > 0:
+            self._draw_animated_meter(draw, meter_value, bar_fill_width, bar_x, bar_width,
+                                    bar_y + bar_height - 9, 6, radius)
+        
+        self._composite_icon(image, icon_left_x, icon_bottom_y, icon_max_size)
 
-            return image
-        except Exception as img_e:
-            log.error(f"Error creating image: {img_e}")
-            log.error(traceback.format_exc())
-            return None
+        return image.copy()
     
     def _draw_rounded_rect(self, draw, bbox, radius, fill):
         """Draw a rounded rectangle"""
         x1, y1, x2, y2 = bbox
+        radius = min(radius, (x2 - x1) // 2, (y2 - y1) // 2)
         if radius <= 0:
             draw.rectangle(bbox, fill=fill)
             return
         
-        draw.rectangle([x1 + radius, y1, x2 - radius, y2], fill=fill)
-        draw.rectangle([x1, y1 + radius, x2, y2 - radius], fill=fill)
-        
-        draw.pieslice([x1, y1, x1 + 2*radius, y1 + 2*radius], 180, 270, fill=fill)
-        draw.pieslice([x2 - 2*radius, y1, x2, y1 + 2*radius], 270, 360, fill=fill)
-        draw.pieslice([x1, y2 - 2*radius, x1 + 2*radius, y2], 90, 180, fill=fill)
-        draw.pieslice([x2 - 2*radius, y2 - 2*radius, x2, y2], 0, 90, fill=fill)
-    
-    def _draw_rounded_rect_outline(self, draw, bbox, radius, outline, width=1):
-        """Draw a rounded rectangle outline"""
-        x1, y1, x2, y2 = bbox
-        if radius <= 0:
-            draw.rectangle(bbox, outline=outline, width=width)
-            return
-        
-        draw.rectangle([x1 + radius, y1, x2 - radius, y1 + width], fill=outline)
-        draw.rectangle([x1 + radius, y2 - width, x2 - radius, y2], fill=outline)
-        draw.rectangle([x1, y1 + radius, x1 + width, y2 - radius], fill=outline)
-        draw.rectangle([x2 - width, y1 + radius, x2, y2 - radius], fill=outline)
-        
-        if width == 1:
-            draw.arc([x1, y1, x1 + 2*radius, y1 + 2*radius], 180, 270, fill=outline)
-            draw.arc([x2 - 2*radius, y1, x2, y1 + 2*radius], 270, 360, fill=outline)
-            draw.arc([x1, y2 - 2*radius, x1 + 2*radius, y2], 90, 180, fill=outline)
-            draw.arc([x2 - 2*radius, y2 - 2*radius, x2, y2], 0, 90, fill=outline)
-        else:
-            for i in range(width):
-                offset = i
-                draw.arc([x1 - offset, y1 - offset, x1 + 2*radius + offset, y1 + 2*radius + offset], 180, 270, fill=outline)
-                draw.arc([x2 - 2*radius - offset, y1 - offset, x2 + offset, y1 + 2*radius + offset], 270, 360, fill=outline)
-                draw.arc([x1 - offset, y2 - 2*radius - offset, x1 + 2*radius + offset, y2 + offset], 90, 180, fill=outline)
-                draw.arc([x2 - 2*radius - offset, y2 - 2*radius - offset, x2 + offset, y2 + offset], 0, 90, fill=outline)
+        draw.rounded_rectangle(bbox, radius=radius, fill=fill)
     
     def _draw_unlinked_bars(self, draw, start_x, bar_width, bar_a_y, bar_b_y, bar_height,
                            bar_a_fill_width, bar_b_fill_width, is_a_selected, is_b_selected, 
                            is_a_muted, is_b_muted):
         """Draw unlinked volume bars (two separate bars) with enhanced visibility"""
         if is_a_muted:
-            bg_color_a = (38, 38, 38, 255)
-            outline_color_a = (102, 153, 255, 255) if is_a_selected else (77, 77, 77, 255)
+            bg_color_a = _BG_MUTED
+            outline_color_a = _OUTLINE_A_SELECTED if is_a_selected else _GREY_MUTED
         else:
-            bg_color_a = (26, 26, 51, 255)
-            outline_color_a = (102, 153, 255, 255) if is_a_selected else (51, 77, 128, 255)
+            bg_color_a = _BG_A
+            outline_color_a = _OUTLINE_A_SELECTED if is_a_selected else _OUTLINE_A
 
         if is_b_muted:
-            bg_color_b = (38, 38, 38, 255)
-            outline_color_b = (255, 153, 51, 255) if is_b_selected else (77, 77, 77, 255)
+            bg_color_b = _BG_MUTED
+            outline_color_b = _OUTLINE_B_SELECTED if is_b_selected else _GREY_MUTED
         else:
-            bg_color_b = (51, 26, 13, 255)
-            outline_color_b = (255, 153, 51, 255) if is_b_selected else (128, 77, 26, 255)
+            bg_color_b = _BG_B
+            outline_color_b = _OUTLINE_B_SELECTED if is_b_selected else _OUTLINE_B
 
         radius = bar_height // 2
 
-        draw.rectangle([start_x, bar_a_y, start_x + bar_width, bar_a_y + bar_height], fill=bg_color_a)
-        draw.rectangle([start_x, bar_a_y, start_x + bar_width, bar_a_y + bar_height], outline=outline_color_a, width=4)
+        self._canvas.paste(_bar_tile(bar_width, bar_height, 0, bg_color_a, outline_color_a, 4), (start_x, bar_a_y))
 
         if bar_a_fill_width > 0:
-            fill_color_a = (77, 77, 77, 255) if is_a_muted else (102, 179, 255, 255)
+            fill_color_a = _GREY_MUTED if is_a_muted else _FILL_A
             fill_x1 = start_x + 4
             fill_x2 = start_x + min(bar_a_fill_width, bar_width - 4)
             fill_y1 = bar_a_y + 4
@@ -403,11 +416,10 @@ class ImageRenderer:
             if fill_x2 > fill_x1:
                 draw.rectangle([fill_x1, fill_y1, fill_x2, fill_y2], fill=fill_color_a)
 
-        draw.rectangle([start_x, bar_b_y, start_x + bar_width, bar_b_y + bar_height], fill=bg_color_b)
-        draw.rectangle([start_x, bar_b_y, start_x + bar_width, bar_b_y + bar_height], outline=outline_color_b, width=4)
+        self._canvas.paste(_bar_tile(bar_width, bar_height, 0, bg_color_b, outline_color_b, 4), (start_x, bar_b_y))
 
         if bar_b_fill_width > 0:
-            fill_color_b = (77, 77, 77, 255) if is_b_muted else (255, 179, 77, 255)
+            fill_color_b = _GREY_MUTED if is_b_muted else _FILL_B
             fill_x1 = start_x + 4
             fill_x2 = start_x + min(bar_b_fill_width, bar_width - 4)
             fill_y1 = bar_b_y + 4
@@ -421,35 +433,40 @@ class ImageRenderer:
     def _draw_unlinked_meters(self, draw, start_x, bar_width, bar_a_y, bar_b_y, bar_height,
                              bar_a_fill_width, bar_b_fill_width, radius):
         """Draw animated meter overlays for unlinked volume bars"""
-        meter_a = self.action._current_meter_a
-        meter_b = self.action._current_meter_b
-
-        if meter_a > 0 and bar_a_fill_width > 0:
-            self._draw_animated_meter(draw, meter_a, bar_a_fill_width, start_x, bar_width,
-                                    bar_a_y + bar_height - 9, 6, radius)
-
-        if meter_b > 0 and bar_b_fill_width > 0:
-            self._draw_animated_meter(draw, meter_b, bar_b_fill_width, start_x, bar_width,
-                                    bar_b_y + bar_height - 9, 6, radius)
+        meters = (
+            (self.action._current_meter_a, bar_a_fill_width, bar_a_y),
+            (self.action._current_meter_b, bar_b_fill_width, bar_b_y),
+        )
+        for meter_value, fill_width, bar_y in meters:
+            rect = self._meter_rect(meter_value, fill_width, start_x, bar_width, bar_y + bar_height - 9, 6)
+            if rect:
+                draw.rectangle(rect, fill=_METER_BLACK)
     
     def _draw_animated_meter(self, draw, meter_value, fill_width, start_x, bar_width, meter_y, meter_height, radius):
         """Draw simple black meter bars"""
+        rect = self._meter_rect(meter_value, fill_width, start_x, bar_width, meter_y, meter_height)
+        if rect:
+            draw.rectangle(rect, fill=_METER_BLACK)
+    
+    def _meter_rect(self, meter_value, fill_width, start_x, bar_width, meter_y, meter_height):
+        """Get the meter bar rectangle inside a volume fill, or None if there is nothing to draw"""
         if meter_value <= 0 or fill_width <= 0:
-            return
+            return None
 
         base_meter_width = int((meter_value / 100.0) * fill_width)
         meter_x1 = start_x
         meter_x2 = start_x + base_meter_width
 
         if meter_x2 <= meter_x1 or meter_y < 0:
-            return
+            return None
 
         edge_inset = 6
         meter_x1_inset = max(meter_x1, start_x + edge_inset)
         meter_x2_inset = min(meter_x2, start_x + bar_width - edge_inset)
 
         if meter_x2_inset > meter_x1_inset:
-            draw.rectangle([meter_x1_inset, meter_y, meter_x2_inset, meter_y + meter_height], fill=(0, 0, 0, 255))
+            return (meter_x1_inset, meter_y, meter_x2_inset, meter_y + meter_height)
+        return None
 
     def _composite_icon(self, image, icon_left_x, icon_bottom_y, icon_max_size):
         """Composite icon onto image if configured"""
@@ -459,7 +476,7 @@ class ImageRenderer:
                 icon_w, icon_h = icon.size
                 scale = min(icon_max_size / icon_w, icon_max_size / icon_h, 1.0)
                 icon_size = (int(icon_w * scale), int(icon_h * scale))
-                icon_resized = icon.resize(icon_size, Image.Resampling.LANCZOS)
+                icon_resized = icon.resize(icon_size, LANCZOS)
                 if icon_resized.mode != 'RGBA':
                     icon_resized = icon_resized.convert('RGBA')
 
@@ -471,66 +488,57 @@ class ImageRenderer:
             log.warning(f"Error compositing icon: {e}")
             pass
     
-    def _render_menu(self):
-        """Render the interactive menu with 3 horizontal full-screen buttons"""
-        image_width = 480
-        image_height = 240
-        image = Image.new("RGBA", (image_width, image_height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
-        
-        button_font = self._load_monospace_font(64)
-        
+    def _build_menu_buttons(self):
+        """Lay out the menu buttons once; the rects are used for drawing and touch hit-testing"""
+        image_width, image_height = self.IMAGE_SIZE
         margin = 15
-        total_margins = margin * 4
-        button_width = (image_width - total_margins) // 3
+        button_width = (image_width - margin * 4) // 3
         button_height = (image_height - (margin * 2)) // 2
         start_x = margin
         start_y = image_height - button_height - margin
         
-        buttons = [
-            ("Link", "link", (100, 200, 100)),
-            ("A", "bus_a", (102, 179, 255)),
-            ("B", "bus_b", (255, 179, 77))
+        return [
+            {
+                'x': start_x + i * (button_width + margin),
+                'y': start_y,
+                'width': button_width,
+                'height': button_height,
+                'action': action_key
+            }
+            for i, (label, action_key, *colors) in enumerate(_MENU_BUTTONS)
         ]
+    
+    def menu_button_at(self, x, y):
+        """Get the menu button at a canvas position (edges inclusive), or None"""
+        for x_min, y_min, x_max, y_max, button in self._menu_hit_rects:
+            if x_min <= x <= x_max and y_min <= y <= y_max:
+                return button
+        return None
+    
+    def _render_menu(self):
+        """Render the interactive menu with 3 horizontal full-screen buttons"""
+        image, draw = self._clear_canvas()
         
-        for i, (label, action_key, color) in enumerate(buttons):
-            x = start_x + i * (button_width + margin)
-            y = start_y
-            
-            if action_key == "link" and self.action.selected_device_id:
-                is_linked = self.action.client.is_volume_linked(self.action.selected_device_id)
-                if is_linked:
-                    label = "Unlink"
-                else:
-                    label = "Link"
-            
-            is_selected = False
-            if action_key == "bus_a" and "A" in self.action.selected_mixes:
-                is_selected = True
-            elif action_key == "bus_b" and "B" in self.action.selected_mixes:
-                is_selected = True
-            elif action_key == "link" and self.action.selected_device_id:
-                is_linked = self.action.client.is_volume_linked(self.action.selected_device_id)
-                is_selected = is_linked
+        button_font = self._load_monospace_font(64)
+        
+        device_id = self.action.selected_device_id
+        is_linked = self.action._is_volume_linked(device_id) if device_id else False
+        selected_mixes = self.action.selected_mixes
+        
+        for button, (label, action_key, color_on, color_dim, outline_color) in zip(self._menu_buttons, _MENU_BUTTONS):
+            x = button['x']
+            y = button['y']
+            button_width = button['width']
+            button_height = button['height']
             
             if action_key == "bus_a":
-                if is_selected:
-                    bg_color = color + (255,)
-                else:
-                    bg_color = tuple(int(c * 0.6) for c in color) + (255,)
-                outline_color = (51, 77, 128, 255)
+                is_selected = "A" in selected_mixes
             elif action_key == "bus_b":
-                if is_selected:
-                    bg_color = color + (255,)
-                else:
-                    bg_color = tuple(int(c * 0.6) for c in color) + (255,)
-                outline_color = (128, 77, 26, 255)
+                is_selected = "B" in selected_mixes
             else:
-                if is_selected:
-                    bg_color = color + (255,)
-                else:
-                    bg_color = tuple(int(c * 0.6) for c in color) + (255,)
-                outline_color = tuple(int(c * 0.9) for c in color) + (255,)
+                is_selected = is_linked
+            
+            bg_color = color_on if is_selected else color_dim
             
             radius = 10
             draw.rounded_rectangle([x, y, x + button_width, y + button_height], 
@@ -541,20 +549,11 @@ class ImageRenderer:
                 icon_x = x + (button_width - icon_size) // 2
                 icon_y = y + (button_height - icon_size) // 2
                 
-                if self.action.selected_device_id:
-                    is_linked = self.action.client.is_volume_linked(self.action.selected_device_id)
-                    icon_name = "linked-white.png" if is_linked else "unlinked-dimmed.png"
-                else:
-                    icon_name = "unlinked-dimmed.png"
+                icon_name = "linked-white.png" if is_linked else "unlinked-dimmed.png"
                 
-                icon_path = self.action.plugin_base.get_asset_path(icon_name, ["icons"])
-                if os.path.exists(icon_path):
-                    link_icon = Image.open(icon_path)
-                    if link_icon.mode == 'P':
-                        link_icon = link_icon.convert('RGBA')
-                    elif link_icon.mode != 'RGBA':
-                        link_icon = link_icon.convert('RGBA')
-                    link_icon_resized = link_icon.resize((icon_size, icon_size), Image.Resampling.LANCZOS)
+                icon_path = self._get_asset_path(icon_name)
+                if icon_path:
+                    link_icon_resized = _load_icon_resized(icon_path, icon_size)
                     image.paste(link_icon_resized, (icon_x, icon_y), link_icon_resized)
             else:
                 text_bbox = draw.textbbox((0, 0), label, font=button_font)
@@ -563,34 +562,22 @@ class ImageRenderer:
                 text_x = x + (button_width - text_width) // 2
                 text_y = y + (button_height - text_height) // 2 - text_bbox[1]
                 
-                draw.text((text_x, text_y), label, fill=(255, 255, 255, 255), font=button_font)
+                draw.text((text_x, text_y), label, fill=_WHITE, font=button_font)
         
-        self._menu_buttons = []
-        for i, (label, action_key, color) in enumerate(buttons):
-            x = start_x + i * (button_width + margin)
-            y = start_y
-            button_info = {
-                'x': x,
-                'y': y,
-                'width': button_width,
-                'height': button_height,
-                'action': action_key
-            }
-            self._menu_buttons.append(button_info)
-        
-        return image
+        return image.copy()
     
     def _set_image_on_action(self, image, device_short):
-        """Set the rendered image on the action"""
+        """Set the rendered image on the action; returns False if the deck rejected it"""
         try:
-            if hasattr(self.action, 'set_label'):
+            if self._has_set_label:
                 self.action.set_label(None)
-            if hasattr(self.action, 'set_bottom_label'):
+            if self._has_set_bottom_label:
                 self.action.set_bottom_label(None)
-            if hasattr(self.action, 'set_top_label'):
+            if self._has_set_top_label:
                 self.action.set_top_label(None)
 
             self.action.set_media(image=image)
-        except Exception as e:
-            log.error(f"Error setting image: {e}")
-            log.error(traceback.format_exc())
+        except Exception:
+            self._log_render_error("Error setting image")
+            return False
+        return True
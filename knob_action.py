@@ -1,9 +1,48 @@
 """Knob-specific action for PipeWeaver"""
 from src.backend.DeckManagement.InputIdentifier import Input  # type: ignore
 from .action_base import PipeWeaverAction
-import threading
 from loguru import logger as log
 
+from gi.repository import GLib
+
+TOUCH_SECTION_WIDTH = 200
+TOUCH_MIN_Y = 70
+TOUCH_MAX_Y = 90
+DISPLAY_WIDTH = 480
+DISPLAY_MIN_Y = 120
+DISPLAY_MAX_Y = 225
+
+_TOUCH_X_SCALE = DISPLAY_WIDTH / TOUCH_SECTION_WIDTH
+_TOUCH_Y_SCALE = (DISPLAY_MAX_Y - DISPLAY_MIN_Y) / (TOUCH_MAX_Y - TOUCH_MIN_Y)
+_MIX_A = frozenset(("A",))
+_MIX_B = frozenset(("B",))
+_MIX_AB = frozenset(("A", "B"))
+_IGNORED_EVENTS = (
+    Input.Touchscreen.Events.DRAG_LEFT,
+    Input.Touchscreen.Events.DRAG_RIGHT,
+    Input.Dial.Events.UP,
+)
+
+
+def _extract_xy(data):
+    """Get the touch position from an event payload, or (None, None) if it has none"""
+    try:
+        return data.x, data.y
+    except AttributeError:
+        pass
+    
+    try:
+        if isinstance(data, dict):
+            if 'x' in data and 'y' in data:
+                return data['x'], data['y']
+            x, y = data['coords']
+            return x, y
+        if isinstance(data, (list, tuple)):
+            return data[0], data[1]
+    except (KeyError, IndexError, TypeError, ValueError):
+        pass
+    return None, None
+
 
 class PipeWeaverKnobAction(PipeWeaverAction):
     """Knob-specific action: Volume on turn, bus selection and linking on touchscreen"""
@@ -11,72 +50,79 @@ class PipeWeaverKnobAction(PipeWeaverAction):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._menu_mode = False
-        self._menu_timer = None
+        self._menu_timer_id = None
         self._menu_timeout = 5.0
+        self._mute_state_cache = None
+        self._event_handlers = {
+            "Dial Touchscreen Long Press": self._on_long_press,
+            "Dial Touchscreen Short Press": self._on_short_press,
+            str(Input.Dial.Events.TURN_CW): self._on_turn_cw,
+            str(Input.Dial.Events.TURN_CCW): self._on_turn_ccw,
+            "Dial Short Up": self._on_short_up,
+        }
     
     def event_callback(self, event, data):
         """Handle input events for knobs"""
-        event_str = str(event)
-        
-        if event_str == "Dial Touchscreen Long Press":
-            if self._menu_mode:
-                self._menu_mode = False
-                self.update_image()
-            return
-        elif event_str == "Dial Touchscreen Short Press":
-            if self._menu_mode:
-                self._handle_menu_touch(event_str, data)
-            else:
-                self._toggle_menu()
-            return
-        elif event_str == "Touchscreen Drag Left":
-            return
-        elif event_str == "Touchscreen Drag Right":
+        if event in _IGNORED_EVENTS:
             return
         
-        if self._menu_mode and ("Touchscreen" in event_str or "Dial Touchscreen" in event_str):
+        event_str = str(event)
+        handler = self._event_handlers.get(event_str)
+        if handler is not None:
+            handler(data)
+        elif self._menu_mode and "Touchscreen" in event_str:
             self._handle_menu_touch(event_str, data)
-            return
-        
-        if event_str == "Dial Up":
-            return
-        
-        if event == Input.Dial.Events.TURN_CW:
-            volume_step = getattr(self, 'volume_step', 5)
-            self._set_volume_relative(volume_step)
-        elif event == Input.Dial.Events.TURN_CCW:
-            volume_step = getattr(self, 'volume_step', 5)
-            self._set_volume_relative(-volume_step)
-        elif event_str == "Dial Short Up":
-            self._toggle_mute()
+    
+    def _on_long_press(self, data):
+        """Long press on the touchscreen closes the menu"""
+        if self._menu_mode:
+            self._menu_mode = False
+            self._schedule_render()
+    
+    def _on_short_press(self, data):
+        """Short press on the touchscreen opens the menu or hits a menu button"""
+        if self._menu_mode:
+            self._handle_menu_touch("Dial Touchscreen Short Press", data)
+        else:
+            self._toggle_menu()
+    
+    def _on_turn_cw(self, data):
+        """Raise the volume by one step"""
+        self._set_volume_relative(getattr(self, 'volume_step', 5))
+    
+    def _on_turn_ccw(self, data):
+        """Lower the volume by one step"""
+        self._set_volume_relative(-getattr(self, 'volume_step', 5))
+    
+    def _on_short_up(self, data):
+        """Dial click toggles mute"""
+        self._toggle_mute()
     
     def _cycle_bus_forward(self):
         """Cycle bus selection forward: A -> B -> Both -> A"""
         if self._cycling_bus or self.selected_device_type != "source":
             return
         
-        if self.selected_device_id and self.client.is_volume_linked(self.selected_device_id):
+        if self.selected_device_id and self._is_volume_linked(self.selected_device_id):
             if "B" not in self.selected_mixes:
-                self._update_mixes(["B"])
+                self._update_mixes(_MIX_B)
             return
         
         if self._have_different_mute_states():
-            self._update_mixes(["A"])
+            self._update_mixes(_MIX_A)
             return
         
         self._cycling_bus = True
         
         try:
-            current_mixes = set(self.selected_mixes)
+            current_mixes = self.selected_mixes
             
-            if current_mixes == {"A"}:
-                new_mixes = ["B"]
-            elif current_mixes == {"B"}:
-                new_mixes = ["A", "B"] if not self._have_different_mute_states() else ["A"]
-            elif current_mixes == {"A", "B"}:
-                new_mixes = ["A"]
+            if current_mixes == _MIX_A:
+                new_mixes = _MIX_B
+            elif current_mixes == _MIX_B:
+                new_mixes = _MIX_AB
             else:
-                new_mixes = ["A"]
+                new_mixes = _MIX_A
             
             self._update_mixes(new_mixes)
         finally:
@@ -84,11 +130,10 @@ class PipeWeaverKnobAction(PipeWeaverAction):
     
     def _update_mixes(self, mixes):
         """Update mix selections and save settings"""
-        self.selected_mixes = set(mixes)
-        settings = self.get_settings()
-        settings["selected_mixes"] = mixes
-        self.set_settings(settings)
-        self.update_image()
+        self._mute_state_cache = None
+        self.selected_mixes = frozenset(mixes)
+        self._update_settings(selected_mixes=sorted(self.selected_mixes))
+        self._schedule_render()
     
     def _toggle_menu(self):
         """Toggle the menu mode on/off"""
@@ -97,84 +142,52 @@ class PipeWeaverKnobAction(PipeWeaverAction):
         else:
             self._menu_mode = True
             self._start_menu_timer()
-            self.update_image()
+            self._schedule_render()
     
     def _start_menu_timer(self):
-        """Start or restart the menu timeout timer"""
-        if self._menu_timer:
-            self._menu_timer.cancel()
+        """Start or restart the menu timeout"""
+        if self._menu_timer_id:
+            GLib.source_remove(self._menu_timer_id)
         
-        self._menu_timer = threading.Timer(self._menu_timeout, self._close_menu)
-        self._menu_timer.start()
+        self._menu_timer_id = GLib.timeout_add(int(self._menu_timeout * 1000), self._on_menu_timeout)
+    
+    def _on_menu_timeout(self):
+        """GLib timeout callback that closes the menu"""
+        self._menu_timer_id = None
+        self._close_menu()
+        return GLib.SOURCE_REMOVE
     
     def _close_menu(self):
         """Close the menu and cancel timer"""
-        if self._menu_timer:
-            self._menu_timer.cancel()
-            self._menu_timer = None
+        if self._menu_timer_id:
+            GLib.source_remove(self._menu_timer_id)
+            self._menu_timer_id = None
         
         if self._menu_mode:
             self._menu_mode = False
-            self.update_image()
+            self._schedule_render()
     
     def _handle_menu_touch(self, event_str, data):
         """Handle touch events when menu is active"""
         try:
             self._start_menu_timer()
             
-            x, y = None, None
-            if hasattr(data, 'x') and hasattr(data, 'y'):
-                x, y = data.x, data.y
-            elif isinstance(data, dict):
-                if 'x' in data and 'y' in data:
-                    x, y = data['x'], data['y']
-                elif 'coords' in data:
-                    x, y = data['coords']
-            elif isinstance(data, (list, tuple)) and len(data) >= 2:
-                x, y = data[0], data[1]
-            
+            x, y = _extract_xy(data)
             if x is None or y is None:
                 self._close_menu()
                 return
             
-            section_width = 200
-            x_in_section = x % section_width
-            
-            touch_min_x, touch_max_x = 0, section_width
-            display_min_x, display_max_x = 0, 480
-            
-            if x_in_section < touch_min_x:
-                mapped_x = display_min_x
-            elif x_in_section > touch_max_x:
-                mapped_x = display_max_x
+            mapped_x = int((x % TOUCH_SECTION_WIDTH) * _TOUCH_X_SCALE)
+            if TOUCH_MIN_Y <= y <= TOUCH_MAX_Y:
+                mapped_y = DISPLAY_MIN_Y + int((y - TOUCH_MIN_Y) * _TOUCH_Y_SCALE)
             else:
-                touch_range = touch_max_x - touch_min_x
-                display_range = display_max_x - display_min_x
-                mapped_x = int(((x_in_section - touch_min_x) / touch_range) * display_range)
-            
-            touch_min_y, touch_max_y = 70, 90
-            display_min_y, display_max_y = 120, 225
-            
-            if y < touch_min_y or y > touch_max_y:
                 mapped_y = -1
-            else:
-                touch_range_y = touch_max_y - touch_min_y
-                display_range_y = display_max_y - display_min_y
-                mapped_y = display_min_y + int(((y - touch_min_y) / touch_range_y) * display_range_y)
             
-            if hasattr(self, '_image_renderer'):
-                for i, button in enumerate(self._image_renderer._menu_buttons):
-                    x_min = button['x']
-                    x_max = button['x'] + button['width']
-                    y_min = button['y']
-                    y_max = button['y'] + button['height']
-                    
-                    x_in_range = x_min <= mapped_x <= x_max
-                    y_in_range = y_min <= mapped_y <= y_max
-                    
-                    if x_in_range and y_in_range:
-                        self._execute_menu_action(button['action'])
-                        return
+            if self._image_renderer is not None:
+                button = self._image_renderer.menu_button_at(mapped_x, mapped_y)
+                if button is not None:
+                    self._execute_menu_action(button['action'])
+                    return
             
             self._close_menu()
             
@@ -197,7 +210,7 @@ class PipeWeaverKnobAction(PipeWeaverAction):
                 log.warning(f"Unknown menu action: {action}")
             
             if self._menu_mode:
-                self.update_image()
+                self._schedule_render()
             
         except Exception as e:
             log.error(f"Error executing menu action {action}: {e}")
@@ -208,34 +221,33 @@ class PipeWeaverKnobAction(PipeWeaverAction):
             return
         
         if (self.selected_device_id and 
-            self.client.is_volume_linked(self.selected_device_id) and 
+            self._is_volume_linked(self.selected_device_id) and 
             bus != "B"):
             return
         
-        current_mixes = set(self.selected_mixes)
-        
-        if bus in current_mixes:
-            current_mixes.discard(bus)
-        else:
-            current_mixes.add(bus)
+        current_mixes = self.selected_mixes ^ {bus}
         
         if not current_mixes:
-            current_mixes = {"A"} if bus == "B" else {"B"}
+            current_mixes = _MIX_A if bus == "B" else _MIX_B
         
-        self._update_mixes(list(current_mixes))
+        self._update_mixes(current_mixes)
     
     def _have_different_mute_states(self):
         """Check if buses A and B have different mute states"""
         if not self.selected_device_id or self.selected_device_type != "source":
             return False
         
+        cache_key = (self.selected_device_id, self._status_version)
+        if self._mute_state_cache is not None and self._mute_state_cache[0] == cache_key:
+            return self._mute_state_cache[1]
+        
         try:
             mix_states, _ = self._get_source_mix_states(["A", "B"])
             a_muted = mix_states.get("A", False)
             b_muted = mix_states.get("B", False)
-            return a_muted != b_muted
+            different = a_muted != b_muted
+            self._mute_state_cache = (cache_key, different)
+            return different
         except Exception as e:
             log.error(f"Error checking mute states: {e}")
             return False
-    
-    
@@ -3,8 +3,8 @@ from src.backend.PluginManager.PluginBase import PluginBase
 from src.backend.PluginManager.ActionHolder import ActionHolder
 from src.backend.DeckManagement.InputIdentifier import Input
 from src.backend.PluginManager.ActionInputSupport import ActionInputSupport
+from src.backend.PluginManager.PluginSettings.Asset import Icon
 from loguru import logger as log
-import traceback
 import os
 
 import gi
@@ -14,6 +14,18 @@ from gi.repository import Gtk, Adw
 
 from .knob_action import PipeWeaverKnobAction
 
+LANGUAGE_CODES = ("auto", "en_US", "es_ES", "fr_FR", "de_DE")
+_LANGUAGE_INDEX = {code: i for i, code in enumerate(LANGUAGE_CODES)}
+
+
+def _load_icon(icon_path):
+    """Decode one icon asset, or None if it can't be loaded"""
+    try:
+        return Icon(icon_path)
+    except Exception as e:
+        log.warning(f"Could not load icon asset {icon_path}: {e}")
+        return None
+
 
 class DeckWeaver(PluginBase):
     """Simplified main plugin class"""
@@ -28,16 +40,32 @@ class DeckWeaver(PluginBase):
     def init_vars(self):
         """Initialize variables"""
         self.lm = self.locale_manager
+        self.tr = self.lm.get
+        self._language_names = None
+        self._plugin_settings = None
+    
+    def _get_plugin_settings(self):
+        """Get the plugin settings, reading them from disk only once"""
+        if self._plugin_settings is None:
+            self._plugin_settings = self.get_settings()
+        return self._plugin_settings
     
     def load_and_apply_settings(self):
         """Load and apply language settings"""
-        settings = self.get_settings()
-        language = settings.get("language", "auto")
+        language = self._get_plugin_settings().get("language", "auto")
         
         if language != "auto":
             self._set_language(language)
         else:
             self.lm.set_to_os_default()
+        
+        self._language_names = None
+    
+    def _get_language_names(self):
+        """Get the display names for LANGUAGE_CODES in the current language"""
+        if self._language_names is None:
+            self._language_names = [self.tr(f"settings.language.name.{code}") for code in LANGUAGE_CODES]
+        return self._language_names
     
     def _set_language(self, language):
         """Set language with fallback methods"""
@@ -57,7 +85,7 @@ class DeckWeaver(PluginBase):
     def register_plugin(self):
         """Register the plugin"""
         self.register(
-            plugin_name=self.lm.get("plugin.name"),
+            plugin_name=self.tr("plugin.name"),
             github_repo="https://github.com/designgears/DeckWeaver",
             plugin_version="1.0.0",
             app_version="1.5.0-beta"
@@ -69,8 +97,7 @@ class DeckWeaver(PluginBase):
             self.load_icon_assets()
             self._register_knob_action()
         except Exception as e:
-            log.error(f"Error registering actions: {e}")
-            log.error(traceback.format_exc())
+            log.exception(f"Error registering actions: {e}")
     
     def _register_knob_action(self):
         """Register knob action"""
@@ -78,7 +105,7 @@ class DeckWeaver(PluginBase):
             plugin_base=self,
             action_base=PipeWeaverKnobAction,
             action_id_suffix="Knob",
-            action_name=self.lm.get("actions.knob.name"),
+            action_name=self.tr("actions.knob.name"),
             action_support={
                 Input.Key: ActionInputSupport.UNSUPPORTED,
                 Input.Dial: ActionInputSupport.SUPPORTED,
@@ -89,50 +116,37 @@ class DeckWeaver(PluginBase):
     
     def load_icon_assets(self):
         """Load icon assets"""
-        try:
-            from src.backend.PluginManager.PluginSettings.Asset import Icon
-            
-            icon_assets = {
-                "pipeweaver": "pipeweaver.png",
-                "audio": "audio.png",
-                "volume": "volume.png",
-                "mute": "mute.png",
-                "a-b-outline": "a-b-outline.png"
-            }
-            
-            for asset_name, filename in icon_assets.items():
-                icon_path = self.get_asset_path(filename, ["icons"])
-                if os.path.exists(icon_path):
-                    icon = Icon(icon_path)
-                    self.asset_manager.icons.add_asset(asset_name, icon)
-                    
-        except Exception as e:
-            log.warning(f"Could not load icon assets: {e}")
+        icon_assets = {
+            "pipeweaver": "pipeweaver.png",
+            "audio": "audio.png",
+            "volume": "volume.png",
+            "mute": "mute.png",
+            "a-b-outline": "a-b-outline.png"
+        }
+        
+        for asset_name, filename in icon_assets.items():
+            icon_path = self.get_asset_path(filename, ["icons"])
+            if not os.path.exists(icon_path):
+                continue
+            icon = _load_icon(icon_path)
+            if icon is None:
+                continue
+            try:
+                self.asset_manager.icons.add_asset(asset_name, icon)
+            except Exception as e:
+                log.warning(f"Could not register icon asset {asset_name}: {e}")
     
     def get_settings_area(self):
         """Create settings UI"""
-        languages = [
-            ("auto", self.lm.get("settings.language.name.auto")),
-            ("en_US", self.lm.get("settings.language.name.en_US")),
-            ("es_ES", self.lm.get("settings.language.name.es_ES")),
-            ("fr_FR", self.lm.get("settings.language.name.fr_FR")),
-            ("de_DE", self.lm.get("settings.language.name.de_DE"))
-        ]
-        
-        language_names = [name for code, name in languages]
-        self.language_model = Gtk.StringList().new(language_names)
+        self.language_model = Gtk.StringList().new(self._get_language_names())
         self.language_dropdown = Adw.ComboRow(
             model=self.language_model,
-            title=self.lm.get("settings.language.label")
+            title=self.tr("settings.language.label")
         )
         
-        settings = self.get_settings()
-        current_language = settings.get("language", "auto")
+        current_language = self._get_plugin_settings().get("language", "auto")
         
-        for i, (code, name) in enumerate(languages):
-            if code == current_language:
-                self.language_dropdown.set_selected(i)
-                break
+        self.language_dropdown.set_selected(_LANGUAGE_INDEX.get(current_language, 0))
         
         self.language_dropdown.connect("notify::selected", self.on_language_changed)
         
@@ -144,18 +158,12 @@ class DeckWeaver(PluginBase):
         """Handle language change"""
         selected_index = combo.get_selected()
         
-        languages = [
-            ("auto", self.lm.get("settings.language.name.auto")),
-            ("en_US", self.lm.get("settings.language.name.en_US")),
-            ("es_ES", self.lm.get("settings.language.name.es_ES")),
-            ("fr_FR", self.lm.get("settings.language.name.fr_FR")),
-            ("de_DE", self.lm.get("settings.language.name.de_DE"))
-        ]
-        
-        if selected_index < len(languages):
-            selected_code, selected_name = languages[selected_index]
+        if selected_index < len(LANGUAGE_CODES):
+            selected_code = LANGUAGE_CODES[selected_index]
             
-            settings = self.get_settings()
+            settings = self._get_plugin_settings()
+            if settings.get("language", "auto") == selected_code:
+                return
             settings["language"] = selected_code
             self.set_settings(settings)
             
@@ -1,8 +1,9 @@
 """Simple SVG to PIL converter using cairosvg"""
 import os
-import io
-import cairosvg
-from PIL import Image
+import functools
+import cairosvg.parser
+import cairosvg.surface
+from PIL import Image, ImageOps
 from loguru import logger as log
 
 
@@ -10,6 +11,9 @@ def svg_to_pil(svg_path: str, size: tuple = (512, 512)) -> 'Image.Image | None':
     """
     Convert SVG file to PIL Image using cairosvg with proper scaling and cropping
     
+    The parsed SVG is reused across sizes until the file changes; callers
+    cache the rasterized image themselves.
+    
     Args:
         svg_path: Path to SVG file
         size: Target size (width, height)
@@ -17,29 +21,17 @@ def svg_to_pil(svg_path: str, size: tuple = (512, 512)) -> 'Image.Image | None':
     Returns:
         PIL Image or None if failed
     """
-    if not os.path.exists(svg_path):
+    try:
+        mtime_ns = os.stat(svg_path).st_mtime_ns
+    except OSError:
         log.error(f"SVG file not found: {svg_path}")
         return None
     
     try:
-        with open(svg_path, 'r', encoding='utf-8') as f:
-            svg_content = f.read()
-        
-        png_data = cairosvg.svg2png(
-            bytestring=svg_content.encode('utf-8'),
-            output_width=size[0],
-            output_height=size[1],
-            background_color='transparent'
-        )
-        
-        image = Image.open(io.BytesIO(png_data))
+        tree = _get_tree(svg_path, mtime_ns)
+        image = _rasterize(tree, size)
         
-        if image.mode != 'RGBA':
-            image = image.convert('RGBA')
-        
-        image = _crop_and_pad(image, padding=2)
-        
-        return image
+        return _crop_and_pad(image, padding=2)
         
     except Exception as e:
         log.error(f"Error converting SVG to PIL: {e}")
@@ -47,6 +39,35 @@ def svg_to_pil(svg_path: str, size: tuple = (512, 512)) -> 'Image.Image | None':
         return None
 
 
+@functools.lru_cache(maxsize=32)
+def _get_tree(svg_path: str, mtime_ns: int):
+    """Get the parsed SVG tree for a file, reusing it across output sizes until the file changes"""
+    with open(svg_path, 'rb') as f:
+        svg_bytes = f.read()
+    
+    return cairosvg.parser.Tree(bytestring=svg_bytes)
+
+
+def _rasterize(tree, size: tuple) -> 'Image.Image':
+    """Render a parsed SVG tree and read the Cairo surface pixels straight into PIL"""
+    surface = cairosvg.surface.PNGSurface(
+        tree, None, 96,
+        output_width=size[0],
+        output_height=size[1],
+        background_color='transparent'
+    )
+    cairo_surface = surface.cairo
+    cairo_surface.flush()
+    
+    # ARGB32 is premultiplied native-endian, i.e. BGRa in memory on little-endian hosts
+    return Image.frombuffer(
+        'RGBA',
+        (cairo_surface.get_width(), cairo_surface.get_height()),
+        cairo_surface.get_data(),
+        'raw', 'BGRa', cairo_surface.get_stride(), 1
+    )
+
+
 def _crop_and_pad(image: 'Image.Image', padding: int = 2) -> 'Image.Image':
     """
     Crop transparent edges from image and add padding, aligning content to bottom
@@ -59,21 +80,15 @@ def _crop_and_pad(image: 'Image.Image', padding: int = 2) -> 'Image.Image':
         Cropped and padded PIL Image with content aligned to bottom
     """
     try:
-        bbox = image.getbbox()
+        bbox = image.getchannel('A').getbbox()
         
         if bbox is None:
             return Image.new('RGBA', (1, 1), (0, 0, 0, 0))
         
         cropped = image.crop(bbox)
         
-        width, height = cropped.size
-        padded_width = width + (padding * 2)
-        padded_height = height + (padding * 2)
-        
-        padded_image = Image.new('RGBA', (padded_width, padded_height), (0, 0, 0, 0))
-        
-        bottom_y = padded_height - height - padding
-        padded_image.paste(cropped, (padding, bottom_y))
+        # Padding is equal on every side, so the content still sits padding px above the bottom edge
+        padded_image = ImageOps.expand(cropped, border=padding, fill=(0, 0, 0, 0))
         
         return padded_image
         
@@ -1,12 +1,81 @@
 """WebSocket client for communicating with PipeWeaver daemon"""
+import contextlib
+import itertools
 import json
+import os
+import random
+import re
+import select
 import threading
-import traceback
 import time
-from queue import Queue, Empty
+from json.encoder import encode_basestring_ascii
 from loguru import logger as log  # type: ignore
 import websocket  # type: ignore
 
+try:
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+RECONNECT_BASE_DELAY = 0.2
+RECONNECT_MAX_DELAY = 5.0
+RECONNECT_MAX_EXPONENT = 5
+RECONNECT_JITTER = 0.05
+PING_INTERVAL = 10.0
+PING_TIMEOUT = 25.0
+RECV_TIMEOUT = 1.0
+METER_DISPATCH_INTERVAL = 0.016
+PATCH_CALLBACK_DELAY = 0.025
+
+_METER_ID_RE = re.compile(rb'"id"\s*:\s*"?([^",}\s]+)')
+_METER_FRAME_RE = re.compile(rb'\s*\{\s*"id"\s*:\s*("?)([^",}\s\\]+)\1\s*,\s*"percent"\s*:\s*(-?\d+)(?:\.\d+)?\s*\}\s*')
+_DATA_OPCODES = (websocket.ABNF.OPCODE_TEXT, websocket.ABNF.OPCODE_BINARY)
+_OK_DICT = {"Ok": None}
+_DEVICES_POINTER = "/audio/profile/devices"
+_DEVICE_KINDS = (("sources", "source"), ("targets", "target"))
+_COMMAND_TEMPLATES = {
+    "SetSourceVolume": (3, '{"id":%d,"data":{"Pipewire":{"SetSourceVolume":[%s,%s,%d]}}}'),
+    "SetTargetVolume": (2, '{"id":%d,"data":{"Pipewire":{"SetTargetVolume":[%s,%d]}}}'),
+}
+
+
+def _reconnect_delay(attempts):
+    """Jittered exponential backoff delay for the given reconnect attempt"""
+    delay = RECONNECT_BASE_DELAY * 2 ** min(attempts, RECONNECT_MAX_EXPONENT)
+    return min(RECONNECT_MAX_DELAY, delay) + random.uniform(0, RECONNECT_JITTER)
+
+
+def _open_wakeup_pipe():
+    """Create the pipe stop() writes to so a receive loop blocked in select() wakes at once"""
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(write_fd, False)
+    return read_fd, write_fd
+
+
+def _signal_wakeup(write_fd):
+    """Wake the receive loop waiting on the other end of the pipe"""
+    try:
+        os.write(write_fd, b"x")
+    except OSError:
+        pass
+
+
+def _close_wakeup_pipe(fds):
+    """Close both ends of a wakeup pipe"""
+    for fd in fds:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+def _wait_readable(sock, wakeup_fd, timeout=None):
+    """Block until sock has data (True), or until the wakeup pipe fires or timeout expires (False)"""
+    readable, _, _ = select.select([sock, wakeup_fd], [], [], timeout)
+    return sock in readable
+
+
 def _decode_json_pointer_token(token):
     """Decode a single JSON Pointer token (~0, ~1 sequences)."""
     return token.replace("~1", "/").replace("~0", "~")
@@ -20,7 +89,11 @@ def _resolve_json_pointer_parent(doc, path):
     if not path.startswith("/"):
         raise ValueError(f"Invalid JSON Pointer path: {path}")
 
-    parts = [_decode_json_pointer_token(p) for p in path.lstrip("/").split("/") if p != ""]
+    parts = path[1:].split("/")
+    if "" in parts:
+        parts = [p for p in parts if p != ""]
+    if "~" in path:
+        parts = [_decode_json_pointer_token(p) for p in parts]
     if not parts:
         raise ValueError("Empty JSON Pointer path")
 
@@ -93,83 +166,257 @@ def apply_status_patch(status, patch):
                 continue
             _apply_single_patch_op(status, op)
         except Exception as e:
-            log.error(f"Error applying patch operation {op}: {e}")
-            log.error(traceback.format_exc())
+            log.exception(f"Error applying patch operation {op}: {e}")
+
+
+def _encode_command(command_id, request_data):
+    """Serialize a command envelope, filling a preformatted template for the frequent volume commands"""
+    pipewire = request_data.get("Pipewire") if isinstance(request_data, dict) else None
+    if isinstance(pipewire, dict) and len(pipewire) == 1:
+        (name, args), = pipewire.items()
+        arity, template = _COMMAND_TEMPLATES.get(name, (None, None))
+        if (template is not None and isinstance(args, list) and len(args) == arity
+                and type(args[-1]) is int and all(isinstance(arg, str) for arg in args[:-1])):
+            return template % (command_id, *map(encode_basestring_ascii, args[:-1]), args[-1])
+    return json.dumps({"id": command_id, "data": request_data})
+
+
+def _touches_devices(path):
+    """Whether a patch path lies inside (or replaces) the device tree that actions read"""
+    return path.startswith(_DEVICES_POINTER) or _DEVICES_POINTER.startswith(path)
+
+
+def _changes_device_layout(path):
+    """Whether a patch path can add, remove, move or rename devices (not just change their state)"""
+    if not path.startswith(_DEVICES_POINTER):
+        return _DEVICES_POINTER.startswith(path)
+    parts = path[len(_DEVICES_POINTER):].split("/")
+    return len(parts) <= 4 or parts[4] == "description"
+
+
+def device_list(status, kind, group="virtual_devices"):
+    """Get a device list (kind "sources"/"targets") from a status dict, or () if it is missing"""
+    try:
+        return status["audio"]["profile"]["devices"][kind][group]
+    except (KeyError, TypeError):
+        return ()
+
+
+class _PendingCommand:
+    """Response slot for one command waiting on its reply"""
+    
+    __slots__ = ("event", "response")
+    
+    def __init__(self):
+        self.event = threading.Event()
+        self.response = None
 
 
 class MeterWebSocketClient:
-    """WebSocket client for receiving meter data"""
+    """WebSocket client for receiving meter data, shared by all actions"""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """Get the shared meter client, creating it on first use"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
 
-    def __init__(self, callback, port=14565):
+    def __init__(self, port=14565):
         if websocket is None:
             raise ImportError("websocket-client library is required. Install it with: pip install websocket-client")
 
-        self.callback = callback
         self.port = port
         self.ws = None
         self.running = False
         self.thread = None
+        self.callbacks = {}
+        self.subscriptions = {}
+        self.callbacks_lock = threading.Lock()
+        self.lifecycle_lock = threading.RLock()
+        self.dispatch_thread = None
+        self._wakeup_fds = None
+        self._wakeup_lock = threading.Lock()
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._pending_event = threading.Event()
+
+    def _remove_subscription(self, callback):
+        """Drop callback from the node it is registered for (callbacks_lock must be held)"""
+        node_id = self.subscriptions.pop(callback, None)
+        node_callbacks = self.callbacks.get(node_id)
+        if node_callbacks is None:
+            return
+        node_callbacks.remove(callback)
+        if not node_callbacks:
+            del self.callbacks[node_id]
+
+    def register(self, node_id, callback):
+        """Route meter updates for node_id to callback, moving any previous registration"""
+        with self.lifecycle_lock:
+            with self.callbacks_lock:
+                self._remove_subscription(callback)
+                self.subscriptions[callback] = node_id
+                self.callbacks.setdefault(node_id, []).append(callback)
+                should_start = not self.running
+            if should_start:
+                self.start()
+
+    def unregister(self, callback):
+        """Stop routing meter updates to callback, stopping the client when no one is left"""
+        with self.lifecycle_lock:
+            with self.callbacks_lock:
+                self._remove_subscription(callback)
+                should_stop = self.running and not self.subscriptions
+            if should_stop:
+                self.stop()
+
+    def _dispatch(self, latest):
+        """Deliver the newest percent per node to the callbacks registered for it"""
+        with self.callbacks_lock:
+            targets = [(node_id, percent, list(self.callbacks[node_id]))
+                       for node_id, percent in latest.items() if node_id in self.callbacks]
+        for node_id, percent, node_callbacks in targets:
+            for callback in node_callbacks:
+                try:
+                    callback(node_id, percent)
+                except Exception as e:
+                    log.error(f"Error in meter callback: {e}")
+
+    def _dispatch_loop(self):
+        """Deliver the newest percent per node to callbacks, at most once per METER_DISPATCH_INTERVAL"""
+        thread = threading.current_thread()
+        while self.running and self.dispatch_thread is thread:
+            self._pending_event.wait()
+            self._pending_event.clear()
+            with self._pending_lock:
+                latest, self._pending = self._pending, {}
+            if latest:
+                self._dispatch(latest)
+                time.sleep(METER_DISPATCH_INTERVAL)
+
+    def _parse_meter_message(self, message, latest):
+        """Parse a raw meter frame into latest, keeping only the newest percent per node"""
+        match = _METER_FRAME_RE.fullmatch(message)
+        if match:
+            node_id = match.group(2).decode("utf-8", "replace")
+            if node_id in self.callbacks:
+                latest[node_id] = int(match.group(3))
+            return
+        
+        match = _METER_ID_RE.search(message)
+        if match and match.group(1).decode("utf-8", "replace") not in self.callbacks:
+            return
+        
+        try:
+            data = _json_loads(message)
+        except json.JSONDecodeError as e:
+            log.warning(f"Failed to parse meter message: {e}")
+            return
+        
+        if 'id' in data and 'percent' in data:
+            latest[str(data['id'])] = int(data['percent'])
+        else:
+            log.warning(f"Meter message missing id or percent: {data}")
 
-    def _run(self):
-        """Run WebSocket client in thread using websocket-client library"""
-        while self.running:
+    def _run(self, wakeup_fds):
+        """Run WebSocket client in thread, closing its wakeup pipe on exit"""
+        try:
+            self._receive_loop(wakeup_fds[0])
+        finally:
+            with self._wakeup_lock:
+                if self._wakeup_fds is wakeup_fds:
+                    self._wakeup_fds = None
+                _close_wakeup_pipe(wakeup_fds)
+
+    def _receive_loop(self, wakeup_fd):
+        """Connect and receive messages using websocket-client library until stopped"""
+        attempts = 0
+        thread = threading.current_thread()
+        while self.running and self.thread is thread:
             try:
                 url = f"ws://localhost:{self.port}/api/websocket/meter"
 
-                self.ws = websocket.create_connection(url, timeout=5)
+                self.ws = websocket.create_connection(url, timeout=5, skip_utf8_validation=True)
+                self.ws.sock.settimeout(RECV_TIMEOUT)
+                attempts = 0
 
-                while self.running:
+                while self.running and self.thread is thread:
                     try:
-                        self.ws.sock.settimeout(1.0)
-                        message = self.ws.recv()
-                        if message:
-                            try:
-                                data = json.loads(message)
-                                if 'id' in data and 'percent' in data:
-                                    node_id = str(data['id'])
-                                    percent = int(data['percent'])
-                                    self.callback(node_id, percent)
-                                else:
-                                    log.warning(f"Meter message missing id or percent: {data}")
-                            except json.JSONDecodeError as e:
-                                log.warning(f"Failed to parse meter message: {e}")
+                        if not _wait_readable(self.ws.sock, wakeup_fd):
+                            continue
+                        opcode, message = self.ws.recv_data()
+                        if opcode == websocket.ABNF.OPCODE_CLOSE:
+                            log.warning("Meter WebSocket connection closed")
+                            break
+                        if opcode in _DATA_OPCODES and message:
+                            latest = {}
+                            self._parse_meter_message(message, latest)
+                            while select.select([self.ws.sock], [], [], 0)[0]:
+                                opcode, message = self.ws.recv_data()
+                                if opcode in _DATA_OPCODES and message:
+                                    self._parse_meter_message(message, latest)
+                            if latest:
+                                with self._pending_lock:
+                                    self._pending.update(latest)
+                                self._pending_event.set()
                     except websocket.WebSocketTimeoutException:
                         continue
                     except websocket.WebSocketConnectionClosedException:
                         log.warning("Meter WebSocket connection closed")
                         break
                     except Exception as e:
-                        log.error(f"Error receiving meter message: {e}")
-                        log.error(traceback.format_exc())
+                        log.exception(f"Error receiving meter message: {e}")
                         break
 
             except Exception as e:
                 if self.running:
-                    log.error(f"Meter WebSocket connection error: {e}")
-                    log.error(traceback.format_exc())
-                self.ws = None
-                if self.running:
-                    time.sleep(5)
+                    log.exception(f"Meter WebSocket connection error: {e}")
+            
+            if self.ws:
+                try:
+                    self.ws.close()
+                except:
+                    pass
+            self.ws = None
+            if self.running:
+                select.select([wakeup_fd], [], [], _reconnect_delay(attempts))
+                attempts += 1
 
     def start(self):
         """Start WebSocket client"""
-        if self.running:
-            log.warning("Meter client already running")
-            return
-        self.running = True
-        self.thread = threading.Thread(target=self._run, daemon=True, name="MeterWebSocket")
-        self.thread.start()
+        with self.lifecycle_lock:
+            if self.running:
+                log.warning("Meter client already running")
+                return
+            self.running = True
+            self._wakeup_fds = _open_wakeup_pipe()
+            self.thread = threading.Thread(target=self._run, args=(self._wakeup_fds,),
+                                           daemon=True, name="MeterWebSocket")
+            self.dispatch_thread = threading.Thread(target=self._dispatch_loop, daemon=True, name="MeterDispatch")
+            self.thread.start()
+            self.dispatch_thread.start()
 
     def stop(self):
         """Stop WebSocket client"""
-        self.running = False
-        if self.ws:
-            try:
-                self.ws.close()
-            except:
-                pass
-        if self.thread:
-            self.thread.join(timeout=2)
+        with self.lifecycle_lock:
+            self.running = False
+            self._pending_event.set()
+            with self._wakeup_lock:
+                if self._wakeup_fds:
+                    _signal_wakeup(self._wakeup_fds[1])
+            if self.ws:
+                try:
+                    self.ws.close()
+                except:
+                    pass
+            for thread in (self.thread, self.dispatch_thread):
+                if thread and thread is not threading.current_thread():
+                    thread.join(timeout=2)
 
 
 class PipeWeaverWebSocketClient:
@@ -182,75 +429,92 @@ class PipeWeaverWebSocketClient:
         self.running = False
         self.thread = None
         self.lock = threading.Lock()
-        self.command_id = 0
+        self._command_ids = itertools.count()
         self.message_queue = {}
         self.status = None
-        self.connected = False
+        self._status_rev = 0
+        self._device_index = None
+        self._device_index_rev = -1
+        self._patch_callback_pending = False
+        self.connected_event = threading.Event()
+        self.status_event = threading.Event()
+        self._batch_local = threading.local()
+        self._wakeup_fds = None
+        self._wakeup_lock = threading.Lock()
+    
+    @property
+    def connected(self):
+        """Whether the WebSocket is currently connected"""
+        return self.connected_event.is_set()
     
     def _send_command(self, request_data, timeout=5.0):
         """Send a command and wait for response"""
-        max_wait = 5.0
-        wait_time = 0.0
-        while not self.connected and wait_time < max_wait:
-            time.sleep(0.1)
-            wait_time += 0.1
+        return self._dispatch_commands([request_data], timeout)[0]
+    
+    def _dispatch_commands(self, requests, timeout=5.0):
+        """Send commands back to back over the socket, then wait for all responses"""
+        responses = [None] * len(requests)
+        if not self.connected_event.wait(5.0):
+            log.error("WebSocket not connected")
+            return responses
         
+        pending = []
         with self.lock:
-            if not self.connected or not self.ws:
+            ws = self.ws
+            if not self.connected or not ws:
                 log.error("WebSocket not connected")
-                return None
+                return responses
             
-            command_id = self.command_id
-            self.command_id += 1
-            
-            ws_request = {
-                "id": command_id,
-                "data": request_data
-            }
-            
-            response_queue = Queue()
-            event = threading.Event()
-            self.message_queue[command_id] = (response_queue, event)
+            for request_data in requests:
+                command_id = next(self._command_ids)
+                slot = _PendingCommand()
+                self.message_queue[command_id] = slot
+                pending.append((command_id, request_data, slot))
         
+        deadline = time.monotonic() + timeout
         try:
-            request_json = json.dumps(ws_request)
-
-            with self.lock:
-                ws = self.ws
-                if not ws or not self.connected:
-                    log.error("WebSocket not connected")
-                    self.message_queue.pop(command_id, None)
-                    return None
-
-            try:
-                ws.send(request_json)
-            except Exception as e:
-                log.error(f"Error sending command {command_id}: {e}")
-                with self.lock:
-                    self.message_queue.pop(command_id, None)
-                return None
-            
-            if event.wait(timeout):
+            for command_id, request_data, _ in pending:
                 try:
-                    response = response_queue.get_nowait()
-                    return response
-                except Empty:
-                    return None
-            else:
-                log.warning(f"Command {command_id} timed out")
-                with self.lock:
-                    self.message_queue.pop(command_id, None)
-                return None
+                    ws.send(_encode_command(command_id, request_data))
+                except Exception as e:
+                    log.error(f"Error sending command {command_id}: {e}")
+                    return responses
+            
+            for i, (command_id, _, slot) in enumerate(pending):
+                if slot.event.wait(max(0.0, deadline - time.monotonic())):
+                    responses[i] = slot.response
+                else:
+                    log.warning(f"Command {command_id} timed out")
         except Exception as e:
             log.error(f"Error sending command: {e}")
+        finally:
             with self.lock:
-                self.message_queue.pop(command_id, None)
-            return None
+                for command_id, _, _ in pending:
+                    self.message_queue.pop(command_id, None)
+        return responses
+    
+    @contextlib.contextmanager
+    def batch(self):
+        """Queue Pipewire commands sent from this thread and pipeline them in one go on exit"""
+        if getattr(self._batch_local, "requests", None) is not None:
+            yield
+            return
+        
+        self._batch_local.requests = []
+        try:
+            yield
+        finally:
+            requests = self._batch_local.requests
+            self._batch_local.requests = None
+            if requests:
+                for request, response in zip(requests, self._dispatch_commands(requests)):
+                    if not self._is_ok_response(response):
+                        log.warning(f"Batched command failed: {request} -> {response}")
     
     def _handle_message(self, message):
         """Handle incoming WebSocket message"""
         try:
-            msg = json.loads(message)
+            msg = _json_loads(message)
             msg_id = msg.get("id")
             msg_data = msg.get("data")
             
@@ -266,66 +530,123 @@ class PipeWeaverWebSocketClient:
 
             with self.lock:
                 if msg_id in self.message_queue:
-                    response_queue, event = self.message_queue[msg_id]
+                    slot = self.message_queue[msg_id]
                     if isinstance(msg_data, dict):
                         if "Status" in msg_data:
                             self.status = msg_data["Status"]
-                            response_queue.put(("Status", self.status))
+                            self._status_rev += 1
+                            self.status_event.set()
+                            slot.response = ("Status", self.status)
                         elif "Err" in msg_data:
-                            response_queue.put(("Err", msg_data["Err"]))
+                            slot.response = ("Err", msg_data["Err"])
                         elif "Pipewire" in msg_data:
-                            response_queue.put(("Pipewire", msg_data["Pipewire"]))
+                            slot.response = ("Pipewire", msg_data["Pipewire"])
                         else:
                             log.warning(f"Unknown response dict format: {msg_data}")
-                            response_queue.put(("Unknown", msg_data))
+                            slot.response = ("Unknown", msg_data)
                     elif msg_data == "Ok":
-                        response_queue.put(("Ok", None))
+                        slot.response = ("Ok", None)
                     else:
                         log.warning(f"Unknown response format: {type(msg_data)} - {msg_data}")
-                        response_queue.put(("Unknown", msg_data))
+                        slot.response = ("Unknown", msg_data)
 
-                    event.set()
+                    slot.event.set()
                     del self.message_queue[msg_id]
                 else:
                     log.warning(f"Received response for unknown command ID: {msg_id}, data: {type(msg_data)}")
         except json.JSONDecodeError as e:
             log.error(f"Failed to parse message: {e}")
         except Exception as e:
-            log.error(f"Error handling message: {e}")
-            log.error(traceback.format_exc())
+            log.exception(f"Error handling message: {e}")
     
     def _handle_patch(self, patch):
         if not self.status:
             with self.lock:
                 self.status = {}
+                self._status_rev += 1
 
         try:
+            paths = [op.get("path") or "" for op in patch if isinstance(op, dict)] if isinstance(patch, list) else []
             with self.lock:
                 apply_status_patch(self.status, patch)
+                if any(_changes_device_layout(path) for path in paths):
+                    self._status_rev += 1
 
-            if self.patch_callback:
-                self.patch_callback(self.status)
+            if any(_touches_devices(path) for path in paths):
+                self._schedule_patch_callback()
         except Exception as e:
-            log.error(f"Error applying patch: {e}")
-            log.error(traceback.format_exc())
+            log.exception(f"Error applying patch: {e}")
     
+    def _schedule_patch_callback(self):
+        """Notify patch_callback once per PATCH_CALLBACK_DELAY, however many patches arrive in between"""
+        if not self.patch_callback:
+            return
+        with self.lock:
+            if self._patch_callback_pending:
+                return
+            self._patch_callback_pending = True
+        timer = threading.Timer(PATCH_CALLBACK_DELAY, self._fire_patch_callback)
+        timer.daemon = True
+        timer.start()
     
-    def _run(self):
-        """Run WebSocket client in thread using websocket-client library"""
-        while self.running:
+    def _fire_patch_callback(self):
+        """Deliver the current status to patch_callback after a burst of patches"""
+        self._patch_callback_pending = False
+        status = self.status
+        callback = self.patch_callback
+        if not callback:
+            return
+        try:
+            callback(status)
+        except Exception as e:
+            log.exception(f"Error in patch callback: {e}")
+    
+    
+    def _run(self, wakeup_fds):
+        """Run WebSocket client in thread, closing its wakeup pipe on exit"""
+        try:
+            self._receive_loop(wakeup_fds[0])
+        finally:
+            with self._wakeup_lock:
+                if self._wakeup_fds is wakeup_fds:
+                    self._wakeup_fds = None
+                _close_wakeup_pipe(wakeup_fds)
+
+    def _receive_loop(self, wakeup_fd):
+        """Connect and receive messages using websocket-client library until stopped"""
+        attempts = 0
+        thread = threading.current_thread()
+        while self.running and self.thread is thread:
             try:
                 url = f"ws://localhost:{self.port}/api/websocket"
 
-                self.ws = websocket.create_connection(url, timeout=5)
-                self.connected = True
+                self.ws = websocket.create_connection(url, timeout=5, skip_utf8_validation=True)
+                self.ws.sock.settimeout(RECV_TIMEOUT)
+                self.connected_event.set()
+                attempts = 0
                 
                 self._request_initial_status_once()
                 
-                while self.running:
+                last_seen = last_ping = time.monotonic()
+                while self.running and self.thread is thread:
+                    now = time.monotonic()
+                    if now - last_seen > PING_TIMEOUT:
+                        log.warning("WebSocket keepalive timed out, reconnecting")
+                        break
+                    if now - last_ping >= PING_INTERVAL:
+                        self.ws.ping()
+                        last_ping = now
+                    
                     try:
-                        self.ws.sock.settimeout(1.0)
-                        message = self.ws.recv()
-                        if message:
+                        deadline = min(last_ping + PING_INTERVAL, last_seen + PING_TIMEOUT)
+                        if not _wait_readable(self.ws.sock, wakeup_fd, max(0.0, deadline - now)):
+                            continue
+                        opcode, message = self.ws.recv_data(control_frame=True)
+                        last_seen = time.monotonic()
+                        if opcode == websocket.ABNF.OPCODE_CLOSE:
+                            log.warning("WebSocket connection closed")
+                            break
+                        if opcode in _DATA_OPCODES and message:
                             self._handle_message(message)
                     except websocket.WebSocketTimeoutException:
                         continue
@@ -333,23 +654,24 @@ class PipeWeaverWebSocketClient:
                         log.warning("WebSocket connection closed")
                         break
                     except Exception as e:
-                        log.error(f"Error receiving message: {e}")
-                        log.error(traceback.format_exc())
+                        log.exception(f"Error receiving message: {e}")
                         break
                         
             except Exception as e:
                 if self.running:
-                    log.error(f"WebSocket connection error: {e}")
-                    log.error(traceback.format_exc())
-                self.connected = False
-                if self.ws:
-                    try:
-                        self.ws.close()
-                    except:
-                        pass
-                self.ws = None
-                if self.running:
-                    time.sleep(5)
+                    log.exception(f"WebSocket connection error: {e}")
+            
+            self.connected_event.clear()
+            self.status_event.clear()
+            if self.ws:
+                try:
+                    self.ws.close()
+                except:
+                    pass
+            self.ws = None
+            if self.running:
+                select.select([wakeup_fd], [], [], _reconnect_delay(attempts))
+                attempts += 1
     
     def start(self):
         """Start WebSocket client"""
@@ -357,13 +679,19 @@ class PipeWeaverWebSocketClient:
             log.warning("WebSocket client already running")
             return
         self.running = True
-        self.thread = threading.Thread(target=self._run, daemon=True, name="PipeWeaverWebSocket")
+        self._wakeup_fds = _open_wakeup_pipe()
+        self.thread = threading.Thread(target=self._run, args=(self._wakeup_fds,),
+                                       daemon=True, name="PipeWeaverWebSocket")
         self.thread.start()
     
     def stop(self):
         """Stop WebSocket client"""
         self.running = False
-        self.connected = False
+        self.connected_event.clear()
+        self.status_event.clear()
+        with self._wakeup_lock:
+            if self._wakeup_fds:
+                _signal_wakeup(self._wakeup_fds[1])
         if self.ws:
             try:
                 self.ws.close()
@@ -376,12 +704,14 @@ class PipeWeaverWebSocketClient:
         """Request initial status once on connection - not polling, just one-time fetch"""
         def request_once():
             try:
-                time.sleep(0.2)
                 request = "GetStatus"
                 response = self._send_command(request, timeout=10.0)
                 if response and response[0] == "Status":
                     with self.lock:
-                        self.status = response[1]  
+                        self.status = response[1]
+                        self._status_rev += 1
+                    if self.patch_callback:
+                        self.patch_callback(self.status)
                 else:
                     log.warning(f"Initial status request failed: {response}")
             except Exception as e:
@@ -390,59 +720,41 @@ class PipeWeaverWebSocketClient:
         threading.Thread(target=request_once, daemon=True, name="InitialStatusRequest").start()
     
     def _get_status(self):
-        """Get status from cache - patches keep it updated, no polling"""
+        """Get status from cache - patches keep it updated, no polling (a plain reference read, no lock needed)"""
+        return self.status
+    
+    def _get_device_index(self):
+        """Get {device_id: (type, device)}, rebuilt only after a patch changes the device layout"""
         with self.lock:
-            return self.status
+            if self._device_index_rev != self._status_rev:
+                index = {}
+                for kind, device_type in _DEVICE_KINDS:
+                    for device in device_list(self.status, kind):
+                        try:
+                            index[device["description"]["id"]] = (device_type, device)
+                        except (KeyError, TypeError):
+                            continue
+                self._device_index = index
+                self._device_index_rev = self._status_rev
+            return self._device_index
     
     def get_devices(self):
         """Get list of PipeWeaver devices"""
-        status = self._get_status()
-        if not status:
-            return []
-        
-        devices = []
         try:
-            profile = status.get("audio", {}).get("profile", {})
-            devices_dict = profile.get("devices", {})
-            
-            sources = devices_dict.get("sources", {}).get("virtual_devices", [])
-            for device in sources:
-                devices.append({
-                    "id": device["description"]["id"],
-                    "name": device["description"]["name"],
-                    "type": "source"
-                })
-            
-            targets = devices_dict.get("targets", {}).get("virtual_devices", [])
-            for device in targets:
-                devices.append({
-                    "id": device["description"]["id"],
-                    "name": device["description"]["name"],
-                    "type": "target"
-                })
+            devices = []
+            for device_id, (device_type, device) in self._get_device_index().items():
+                name = (device.get("description") or {}).get("name")
+                if name:
+                    devices.append({"id": device_id, "name": name, "type": device_type})
+            return devices
         except Exception as e:
             log.error(f"Failed to parse device list: {e}")
-        
-        return devices
+            return []
     
     def _get_device_type(self, device_id):
         """Get device type (source/target) for a given device ID"""
-        status = self._get_status()
-        if not status:
-            return None
-        
-        profile = status.get("audio", {}).get("profile", {})
-        devices_dict = profile.get("devices", {})
-        
-        for device in devices_dict.get("sources", {}).get("virtual_devices", []):
-            if device["description"]["id"] == device_id:
-                return "source"
-        
-        for device in devices_dict.get("targets", {}).get("virtual_devices", []):
-            if device["description"]["id"] == device_id:
-                return "target"
-        
-        return None
+        entry = self._get_device_index().get(device_id)
+        return entry[0] if entry else None
     
     def mute_device(self, device_id, target=None):
         """Mute a device"""
@@ -467,10 +779,10 @@ class PipeWeaverWebSocketClient:
             command = {"AddSourceMuteTarget": [device_id, mute_target]}
             return self._send_pipewire_command(command)
         else:
-            command_a = {"AddSourceMuteTarget": [device_id, "TargetA"]}
-            command_b = {"AddSourceMuteTarget": [device_id, "TargetB"]}
-            return (self._send_pipewire_command(command_a) and 
-                    self._send_pipewire_command(command_b))
+            return self._send_pipewire_commands([
+                {"AddSourceMuteTarget": [device_id, "TargetA"]},
+                {"AddSourceMuteTarget": [device_id, "TargetB"]},
+            ])
     
     def _mute_target_device(self, device_id):
         """Mute a target device"""
@@ -478,10 +790,30 @@ class PipeWeaverWebSocketClient:
         return self._send_pipewire_command(command)
     
     def _send_pipewire_command(self, command):
-        """Send a PipeWeaver command and return success status"""
+        """Send a PipeWeaver command and return success status (always True when queued inside batch())"""
         request = {"Pipewire": command}
-        response = self._send_command(request)
-        return response and response[0] == "Pipewire" and response[1] in ["Ok", {"Ok": None}]
+        batched = getattr(self._batch_local, "requests", None)
+        if batched is not None:
+            batched.append(request)
+            return True
+        return self._is_ok_response(self._send_command(request))
+    
+    def _send_pipewire_commands(self, commands):
+        """Send several PipeWeaver commands back to back and return whether all of them succeeded"""
+        requests = [{"Pipewire": command} for command in commands]
+        batched = getattr(self._batch_local, "requests", None)
+        if batched is not None:
+            batched.extend(requests)
+            return True
+        return all(self._is_ok_response(response) for response in self._dispatch_commands(requests))
+    
+    @staticmethod
+    def _is_ok_response(response):
+        """Check whether a command response reports success"""
+        if not response or response[0] != "Pipewire":
+            return False
+        result = response[1]
+        return result == "Ok" or (isinstance(result, dict) and result == _OK_DICT)
     
     def unmute_device(self, device_id, target=None):
         """Unmute a device"""
@@ -506,10 +838,10 @@ class PipeWeaverWebSocketClient:
             command = {"DelSourceMuteTarget": [device_id, mute_target]}
             return self._send_pipewire_command(command)
         else:
-            command_a = {"DelSourceMuteTarget": [device_id, "TargetA"]}
-            command_b = {"DelSourceMuteTarget": [device_id, "TargetB"]}
-            return (self._send_pipewire_command(command_a) and 
-                    self._send_pipewire_command(command_b))
+            return self._send_pipewire_commands([
+                {"DelSourceMuteTarget": [device_id, "TargetA"]},
+                {"DelSourceMuteTarget": [device_id, "TargetB"]},
+            ])
     
     def _unmute_target_device(self, device_id):
         """Unmute a target device"""
@@ -552,25 +884,15 @@ class PipeWeaverWebSocketClient:
         """Enable/disable volume linking for a source device"""
         command = {"SetSourceVolumeLinked": [device_id, linked]}
         request = {"Pipewire": command}
-        response = self._send_command(request)
-        
-        if response and response[0] == "Pipewire":
-            return response[1] in ["Ok", {"Ok": None}]
-        return False
+        return self._is_ok_response(self._send_command(request))
     
         
     def is_volume_linked(self, device_id):
         """Check if volumes are linked for a source device"""
         try:
-            status = self._get_status()
-            if status:
-                profile = status.get("audio", {}).get("profile", {})
-                devices = profile.get("devices", {})
-                for device in devices.get("sources", {}).get("virtual_devices", []):
-                    if device["description"]["id"] == device_id:
-                        volumes = device.get("volumes", {})
-                        volumes_linked = volumes.get("volumes_linked")
-                        return volumes_linked is not None
+            entry = self._get_device_index().get(device_id)
+            if entry and entry[0] == "source":
+                return entry[1].get("volumes", {}).get("volumes_linked") is not None
         except Exception as e:
             log.error(f"Error checking link status: {e}")
         